@@ -1041,7 +1041,8 @@ class SoundLightTransport:
             return
         request_id = response.requestId
         status_code = response.statusCode if response.HasField("statusCode") else 200
-        future = self._pending_responses.get(speaker_uid, {}).get(request_id)
+        pending = self._pending_responses.get(speaker_uid)
+        future = pending.get(request_id) if pending else None
         if future is not None and not future.done():
             future.set_result(status_code)
 
@@ -1250,7 +1251,8 @@ class SoundLightTransport:
                         f"WebSocket closed sending command id={message_id} on {speaker_uid}"
                     ) from e
                 finally:
-                    self._pending_responses.get(speaker_uid, {}).pop(message_id, None)
+                    if (pending := self._pending_responses.get(speaker_uid)) is not None:
+                        pending.pop(message_id, None)
                     self._inflight_conn_key.pop(speaker_uid, None)
                     # When send() raised, the handler may ALSO have failed this
                     # future: retrieve the exception so asyncio doesn't log an
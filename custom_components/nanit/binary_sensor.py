@@ -12,7 +12,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from aionanit.models import CameraState, CloudEvent, ConnectionState
@@ -53,7 +53,7 @@ BINARY_SENSORS: tuple[NanitBinarySensorEntityDescription, ...] = (
 class NanitCloudBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describe a Nanit cloud binary sensor."""
 
-    event_type: str  # "MOTION" or "SOUND" (uppercase, matches API)
+    event_type: str  # "MOTION" or "SOUND" (uppercase, canonicalized by the coordinator)
 
 
 CLOUD_BINARY_SENSORS: tuple[NanitCloudBinarySensorEntityDescription, ...] = (
@@ -112,6 +112,7 @@ class NanitBinarySensor(NanitEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.camera.uid}_{description.key}"
+        self._attr_is_on = self._value_from_data()
 
     @property
     def available(self) -> bool:
@@ -125,8 +126,7 @@ class NanitBinarySensor(NanitEntity, BinarySensorEntity):
             return self.coordinator.last_update_success and self.coordinator.data is not None
         return super().available
 
-    @property
-    def is_on(self) -> bool | None:
+    def _value_from_data(self) -> bool | None:
         """Return true if the binary sensor is on.
 
         The connectivity sensor uses the coordinator's debounced ``connected``
@@ -140,6 +140,16 @@ class NanitBinarySensor(NanitEntity, BinarySensorEntity):
             return bool(self.coordinator.connected)
         return self.entity_description.value_fn(self.coordinator.data)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the on/off state once per update instead of per state read."""
+        self._attr_is_on = self._value_from_data()
+        super()._handle_coordinator_update()
+
+    def _state_fingerprint(self) -> tuple[bool | None]:
+        """Return the on/off state so unrelated pushes skip the state write."""
+        return (self._attr_is_on,)
+
 
 class NanitCloudBinarySensor(NanitCloudEntity, BinarySensorEntity):
     """Cloud-based binary sensor that detects motion/sound from Nanit cloud events.
@@ -147,6 +157,9 @@ class NanitCloudBinarySensor(NanitCloudEntity, BinarySensorEntity):
     Polls the cloud API every 30s and checks for events within a 5-minute window.
     If an event of the matching type is found within the window, the sensor is ON.
     Otherwise it is OFF (automatically clears after 5 minutes from the last event).
+
+    The newest matching timestamp is cached per coordinator payload, so the
+    event list is only scanned once per poll rather than on every state read.
     """
 
     entity_description: NanitCloudBinarySensorEntityDescription
@@ -160,28 +173,37 @@ class NanitCloudBinarySensor(NanitCloudEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.baby.camera_uid}_{description.key}"
+        self._scanned_events: list[CloudEvent] | None = None
+        self._latest_event_ts: float | None = None
 
     @property
     def is_on(self) -> bool | None:
         """Return true if a matching event was found within the detection window."""
-        if self.coordinator.data is None:
+        events: list[CloudEvent] | None = self.coordinator.data
+        if events is None:
             return None
 
-        events: list[CloudEvent] = self.coordinator.data
-        if not events:
+        # The coordinator hands out a new list on every successful poll, so
+        # an identical object means nothing changed since the last scan.
+        if events is not self._scanned_events:
+            self._scanned_events = events
+            self._latest_event_ts = self._latest_matching_timestamp(events)
+
+        latest = self._latest_event_ts
+        if latest is None:
             return False
+        return latest >= time_mod.time() - CLOUD_EVENT_WINDOW
 
-        now = time_mod.time()
-        cutoff = now - CLOUD_EVENT_WINDOW
+    def _latest_matching_timestamp(self, events: list[CloudEvent]) -> float | None:
+        """Return the newest timestamp among events of this sensor's type."""
         target_type = self.entity_description.event_type
-
+        latest: float | None = None
         for event in events:
-            if event.event_type.upper() != target_type:
+            if event.event_type != target_type:
                 continue
-            if event.timestamp >= cutoff:
-                return True
-
-        return False
+            if latest is None or event.timestamp > latest:
+                latest = event.timestamp
+        return latest
 
 
 class NanitSLConnectivitySensor(NanitSoundLightEntity, BinarySensorEntity):
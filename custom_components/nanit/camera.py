@@ -51,8 +51,10 @@ async def async_setup_entry(
             "async_reset_stream",
         )
     async_add_entities(
-        NanitCameraEntity(cam_data.push_coordinator, cam_data.camera)
-        for cam_data in entry.runtime_data.cameras.values()
+        [
+            NanitCameraEntity(cam_data.push_coordinator, cam_data.camera)
+            for cam_data in entry.runtime_data.cameras.values()
+        ]
     )
 
 
@@ -83,6 +85,7 @@ class NanitCameraEntity(NanitEntity, Camera):
         self._cancel_stream_keepalive_timer: CALLBACK_TYPE | None = None
         self._stream_refresh_task: asyncio.Task[None] | None = None
         self._stream_keepalive_task: asyncio.Task[bool] | None = None
+        self._snapshot_fetch_task: asyncio.Task[bytes | None] | None = None
 
     @property
     def is_on(self) -> bool:
@@ -134,11 +137,16 @@ class NanitCameraEntity(NanitEntity, Camera):
         camera's push away from the replacement entity's stream.
         """
         self._invalidate_stream("entity removal")
-        for task in (self._stream_refresh_task, self._stream_keepalive_task):
+        for task in (
+            self._stream_refresh_task,
+            self._stream_keepalive_task,
+            self._snapshot_fetch_task,
+        ):
             if task is not None and not task.done():
                 task.cancel()
         self._stream_refresh_task = None
         self._stream_keepalive_task = None
+        self._snapshot_fetch_task = None
         await super().async_will_remove_from_hass()
 
     def _invalidate_stream(self, reason: str = "state change") -> None:
@@ -150,7 +158,7 @@ class NanitCameraEntity(NanitEntity, Camera):
             # its normal idle cleanup. Stop it before replacing the cached stream
             # to prevent overlapping workers during frontend recovery.
             if self.hass is not None:
-                self.hass.create_task(
+                self.hass.async_create_task(
                     self._stop_discarded_stream(old_stream),
                     name=f"nanit_stop_discarded_stream_{self._camera.uid}",
                 )
@@ -505,6 +513,7 @@ class NanitCameraEntity(NanitEntity, Camera):
 
         A background prefetch is scheduled when the cache reaches
         ``_SNAPSHOT_PREFETCH_AGE`` so subsequent requests hit a warm cache.
+        Concurrent callers share a single in-flight fetch.
         """
         if not self.is_on:
             return None
@@ -514,21 +523,27 @@ class NanitCameraEntity(NanitEntity, Camera):
 
         if self._cached_snapshot is not None and cache_age < _SNAPSHOT_CACHE_TTL:
             if cache_age >= _SNAPSHOT_PREFETCH_AGE:
-                self.hass.async_create_background_task(
-                    self._async_refresh_snapshot(),
-                    name=f"nanit_snapshot_refresh_{self._camera.uid}",
-                )
+                self._start_snapshot_fetch()
             return self._cached_snapshot
 
-        fresh = await self._async_fetch_snapshot()
+        # Shielded so a caller that gives up doesn't abort the fetch that
+        # other callers are waiting on.
+        fresh = await asyncio.shield(self._start_snapshot_fetch())
         if fresh is not None:
             return fresh
 
         return self._cached_snapshot
 
-    async def _async_refresh_snapshot(self) -> None:
-        """Background task: update the snapshot cache without blocking callers."""
-        await self._async_fetch_snapshot()
+    def _start_snapshot_fetch(self) -> asyncio.Task[bytes | None]:
+        """Return the in-flight snapshot fetch, starting one if none is running."""
+        task = self._snapshot_fetch_task
+        if task is None or task.done():
+            task = self.hass.async_create_background_task(
+                self._async_fetch_snapshot(),
+                name=f"nanit_snapshot_fetch_{self._camera.uid}",
+            )
+            self._snapshot_fetch_task = task
+        return task
 
     async def _async_fetch_snapshot(self) -> bytes | None:
         """Fetch a snapshot from the cloud and update the cache."""
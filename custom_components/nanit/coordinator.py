@@ -17,6 +17,8 @@ NanitSoundLightCoordinator: Push-based coordinator wrapping NanitSoundLight.subs
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import logging
 import math
 from collections.abc import Callable
@@ -57,6 +59,11 @@ class NanitPushCoordinator(DataUpdateCoordinator[CameraState]):
     callback on every state change. Entity availability is driven by the
     ``connected`` flag which tracks the WebSocket connection state, debounced
     by a grace period so brief reconnections don't flash "Unavailable".
+    Events delivered in the same loop iteration (e.g. the initial state
+    responses) are coalesced into a single listener update.
+
+    The camera subscription and WebSocket lifecycle are owned by ``NanitHub``;
+    this coordinator only translates camera events into entity updates.
     """
 
     config_entry: NanitConfigEntry
@@ -78,21 +85,21 @@ class NanitPushCoordinator(DataUpdateCoordinator[CameraState]):
         self.camera = camera
         self.baby = baby
         self.connected: bool = False
-        self._unsubscribe: Callable[[], None] | None = None
         self._availability_timer: CALLBACK_TYPE | None = None
+        self._pending_state: CameraState | None = None
+        self._flush_handle: asyncio.Handle | None = None
 
     async def async_setup(self) -> None:
-        """Start the camera and subscribe to push events.
+        """Seed connection state and data from the started camera.
 
-        Called once from async_setup_entry after the coordinator is created.
+        Called by the hub once it has subscribed this coordinator to the
+        camera and started the WebSocket connection.
         """
-        self._unsubscribe = self.camera.subscribe(self._on_camera_event)
-        await self.camera.async_start()
         self.connected = self.camera.connected
         self.async_set_updated_data(self.camera.state)
 
     @callback
-    def _on_camera_event(self, event: CameraEvent) -> None:
+    def async_handle_camera_event(self, event: CameraEvent) -> None:
         """Handle a push event from NanitCamera.subscribe()."""
         transport_connected = self.camera.connected
 
@@ -116,7 +123,17 @@ class NanitPushCoordinator(DataUpdateCoordinator[CameraState]):
         # If already disconnected (self.connected is False) and transport is
         # still disconnected, do nothing — timer is already running or fired.
 
-        self.async_set_updated_data(event.state)
+        self._pending_state = event.state
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._flush_pending_state)
+
+    @callback
+    def _flush_pending_state(self) -> None:
+        """Publish the newest state received since the flush was scheduled."""
+        self._flush_handle = None
+        state, self._pending_state = self._pending_state, None
+        if state is not None:
+            self.async_set_updated_data(state)
 
     @callback
     def _on_availability_timeout(self, _now: object) -> None:
@@ -132,8 +149,14 @@ class NanitPushCoordinator(DataUpdateCoordinator[CameraState]):
             self.async_update_listeners()
 
     def _start_availability_timer(self) -> None:
-        """Start (or restart) the grace period timer."""
-        self._cancel_availability_timer()
+        """Start the grace period timer unless one is already pending.
+
+        Further disconnect events during the grace period (each reconnect
+        attempt reports one) keep the pending timer instead of rescheduling
+        it, so the grace period is measured from the first drop.
+        """
+        if self._availability_timer is not None:
+            return
         self._availability_timer = async_call_later(
             self.hass, _AVAILABILITY_GRACE_SECONDS, self._on_availability_timeout
         )
@@ -145,20 +168,29 @@ class NanitPushCoordinator(DataUpdateCoordinator[CameraState]):
             self._availability_timer = None
 
     async def async_shutdown(self) -> None:
-        """Stop the camera and unsubscribe."""
+        """Cancel pending timers; the hub stops the camera itself."""
         self._cancel_availability_timer()
-        if self._unsubscribe is not None:
-            self._unsubscribe()
-            self._unsubscribe = None
-        await self.camera.async_stop()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_state = None
         await super().async_shutdown()
 
 
+def _canonicalize_event(event: CloudEvent) -> CloudEvent:
+    """Return the event with its type upper-cased to match the API constants."""
+    event_type = event.event_type.upper()
+    if event_type == event.event_type:
+        return event
+    return dataclasses.replace(event, event_type=event_type)
+
+
 class NanitCloudCoordinator(DataUpdateCoordinator[list[CloudEvent]]):
     """Polling coordinator for Nanit cloud motion/sound events.
 
     Polls GET /babies/{uid}/messages every CLOUD_POLL_INTERVAL seconds.
     Entities check event timestamps against a window to determine on/off state.
+    Event types are upper-cased once here so entities can compare them directly.
     """
 
     config_entry: NanitConfigEntry
@@ -190,7 +222,7 @@ class NanitCloudCoordinator(DataUpdateCoordinator[list[CloudEvent]]):
             events: list[CloudEvent] = await client.rest_client.async_get_events(
                 token, self.baby.uid
             )
-            return events
+            return [_canonicalize_event(event) for event in events]
         except NanitAuthError as err:
             raise ConfigEntryAuthFailed(
                 translation_domain=DOMAIN,
@@ -529,8 +561,14 @@ class NanitSoundLightCoordinator(DataUpdateCoordinator[SoundLightFullState]):
             self.async_update_listeners()
 
     def _start_availability_timer(self) -> None:
-        """Start (or restart) the grace period timer."""
-        self._cancel_availability_timer()
+        """Start the grace period timer unless one is already pending.
+
+        Further disconnect events during the grace period (each reconnect
+        attempt reports one) keep the pending timer instead of rescheduling
+        it, so the grace period is measured from the first drop.
+        """
+        if self._availability_timer is not None:
+            return
         self._availability_timer = async_call_later(
             self.hass, _AVAILABILITY_GRACE_SECONDS, self._on_availability_timeout
         )
@@ -10,22 +10,24 @@ from homeassistant.core import HomeAssistant
 
 from . import NanitConfigEntry
 
-TO_REDACT = {
-    "email",
-    "password",
-    "access_token",
-    "refresh_token",
-    "mfa_token",
-    "mfa_code",
-    "baby_uid",
-    "camera_uid",
-    "camera_ip",
-    "camera_ips",
-    "speaker_ip",
-    "speaker_ips",
-    "speaker_uid",
-    "speaker_uid_map",
-}
+TO_REDACT = frozenset(
+    {
+        "email",
+        "password",
+        "access_token",
+        "refresh_token",
+        "mfa_token",
+        "mfa_code",
+        "baby_uid",
+        "camera_uid",
+        "camera_ip",
+        "camera_ips",
+        "speaker_ip",
+        "speaker_ips",
+        "speaker_uid",
+        "speaker_uid_map",
+    }
+)
 
 
 async def async_get_config_entry_diagnostics(
@@ -59,8 +61,8 @@ async def async_get_config_entry_diagnostics(
         cameras_diag[camera_uid] = cam_diag
 
     return {
-        "config_entry_data": async_redact_data(dict(entry.data), TO_REDACT),
-        "config_entry_options": async_redact_data(dict(entry.options), TO_REDACT),
+        "config_entry_data": async_redact_data(entry.data, TO_REDACT),
+        "config_entry_options": async_redact_data(entry.options, TO_REDACT),
         "camera_count": len(cameras_diag),
         "cameras": async_redact_data(cameras_diag, TO_REDACT),
     }
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
@@ -15,7 +19,38 @@ from .coordinator import (
 from .sanitize import display_name
 
 
-class NanitEntity(CoordinatorEntity[NanitPushCoordinator]):
+class _WriteOnChangeEntity(Entity):
+    """Entity mixin that skips coordinator-driven writes of unchanged state.
+
+    Subclasses that return a value from ``_state_fingerprint`` only write
+    state when that value or availability changed, so unrelated pushes
+    (e.g. a settings change reaching a temperature sensor) are skipped.
+    """
+
+    _last_written_state: tuple[bool, Any] | None = None
+
+    def _state_fingerprint(self) -> Any:
+        """Return the value this entity renders, or None to always write state."""
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the rendered value or availability changed."""
+        self._async_write_state_if_changed()
+
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write state unless it matches what was last written."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint is not None:
+            written = (self.available, fingerprint)
+            if written == self._last_written_state:
+                return
+            self._last_written_state = written
+        self.async_write_ha_state()
+
+
+class NanitEntity(_WriteOnChangeEntity, CoordinatorEntity[NanitPushCoordinator]):
     """Base entity for Nanit — backed by the push coordinator."""
 
     _attr_has_entity_name = True
@@ -58,7 +93,7 @@ class NanitCloudEntity(CoordinatorEntity[NanitCloudCoordinator]):
         )
 
 
-class NanitSoundLightEntity(CoordinatorEntity[NanitSoundLightCoordinator]):
+class NanitSoundLightEntity(_WriteOnChangeEntity, CoordinatorEntity[NanitSoundLightCoordinator]):
     """Base entity for the Nanit Sound & Light Machine — backed by the push coordinator."""
 
     _attr_has_entity_name = True
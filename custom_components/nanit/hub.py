@@ -73,7 +73,12 @@ class NanitHub:
         session: aiohttp.ClientSession,
         entry: NanitConfigEntry,
     ) -> None:
-        """Initialize the hub with an existing session and config entry."""
+        """Initialize the hub with an existing session and config entry.
+
+        ``session`` is Home Assistant's shared client session so REST calls,
+        token refreshes and camera sockets reuse one connection pool. The hub
+        borrows it and never closes it; ``async_close`` only closes the client.
+        """
         from aionanit.client import NanitClient
 
         self._hass = hass
@@ -83,7 +88,7 @@ class NanitHub:
         self._babies: list[Baby] = []
         self._failed_camera_uids: set[str] = set()
         self._sound_lights: dict[str, NanitSoundLight] = {}
-        self._unsubscribe_tokens: Callable[[], None] | None = None
+        self._unsubscribe_cameras: list[Callable[[], None]] = []
 
     @property
     def client(self) -> NanitClient:
@@ -118,10 +123,11 @@ class NanitHub:
         refresh_token = self._entry.data[CONF_REFRESH_TOKEN]
         self._client.restore_tokens(access_token, refresh_token)
 
-        # Register callback to persist refreshed tokens
+        # Register callback to persist refreshed tokens. Tying the unsubscribe
+        # to the entry means it runs on unload and on every failed setup.
         tm = self._client.token_manager
         if tm is not None:
-            self._unsubscribe_tokens = tm.on_tokens_refreshed(self._on_tokens_refreshed)
+            self._entry.async_on_unload(tm.on_tokens_refreshed(self._on_tokens_refreshed))
 
         # Fetch babies (also validates tokens)
         babies = await self._client.async_get_babies()
@@ -240,20 +246,22 @@ class NanitHub:
         )
 
         push_coordinator = NanitPushCoordinator(self._hass, self._entry, camera, baby)
+        await self._async_start_camera(camera, push_coordinator)
         await push_coordinator.async_setup()
 
-        cloud_coordinator: NanitCloudCoordinator | None = None
-        try:
-            cloud_coordinator = NanitCloudCoordinator(self._hass, self._entry, self, baby)
-            await cloud_coordinator.async_config_entry_first_refresh()
-        except NanitAuthError:
-            raise
-        except NanitConnectionError:
-            _LOGGER.warning(
-                "Cloud coordinator for %s failed to start; cloud sensors disabled",
-                baby.name,
-            )
-            cloud_coordinator = None
+        # The cloud and network coordinators poll independent endpoints, so
+        # their first refreshes overlap instead of costing two round-trips.
+        cloud_result, network_result = await asyncio.gather(
+            self._async_setup_cloud_coordinator(baby),
+            self._async_setup_network_coordinator(baby),
+            return_exceptions=True,
+        )
+        if isinstance(cloud_result, BaseException):
+            raise cloud_result
+        if isinstance(network_result, BaseException):
+            raise network_result
+        cloud_coordinator = cloud_result
+        network_coordinator = network_result
 
         # Sound & Light Machine coordinator (optional — local WebSocket push)
         sound_light_coordinator: NanitSoundLightCoordinator | None = None
@@ -286,20 +294,6 @@ class NanitHub:
 
         ir.async_delete_issue(self._hass, DOMAIN, f"camera_connection_failed_{baby.camera_uid}")
 
-        # Network diagnostics coordinator (optional — polls GET /babies for WiFi info)
-        network_coordinator: NanitNetworkCoordinator | None = None
-        try:
-            network_coordinator = NanitNetworkCoordinator(self._hass, self._entry, self, baby)
-            await network_coordinator.async_config_entry_first_refresh()
-        except NanitAuthError:
-            raise
-        except NanitConnectionError:
-            _LOGGER.debug(
-                "Network coordinator for %s failed to start; network sensors disabled",
-                baby.name,
-            )
-            network_coordinator = None
-
         self._camera_data[baby.camera_uid] = CameraData(
             camera=camera,
             baby=baby,
@@ -309,6 +303,50 @@ class NanitHub:
             network_coordinator=network_coordinator,
         )
 
+    async def _async_setup_cloud_coordinator(self, baby: Baby) -> NanitCloudCoordinator | None:
+        """Create the cloud events coordinator, or None if the cloud is unreachable."""
+        cloud_coordinator = NanitCloudCoordinator(self._hass, self._entry, self, baby)
+        try:
+            await cloud_coordinator.async_config_entry_first_refresh()
+        except NanitConnectionError:
+            _LOGGER.warning(
+                "Cloud coordinator for %s failed to start; cloud sensors disabled",
+                baby.name,
+            )
+            return None
+        return cloud_coordinator
+
+    async def _async_setup_network_coordinator(self, baby: Baby) -> NanitNetworkCoordinator | None:
+        """Create the network diagnostics coordinator (polls GET /babies for WiFi info)."""
+        network_coordinator = NanitNetworkCoordinator(self._hass, self._entry, self, baby)
+        try:
+            await network_coordinator.async_config_entry_first_refresh()
+        except NanitConnectionError:
+            _LOGGER.debug(
+                "Network coordinator for %s failed to start; network sensors disabled",
+                baby.name,
+            )
+            return None
+        return network_coordinator
+
+    async def _async_start_camera(
+        self,
+        camera: NanitCamera,
+        push_coordinator: NanitPushCoordinator,
+    ) -> None:
+        """Subscribe the push coordinator to camera events and start the WebSocket.
+
+        The hub owns the subscription so reconnects and teardown stay with the
+        camera lifecycle rather than the coordinator's update semantics.
+        """
+        unsubscribe = camera.subscribe(push_coordinator.async_handle_camera_event)
+        try:
+            await camera.async_start()
+        except BaseException:
+            unsubscribe()
+            raise
+        self._unsubscribe_cameras.append(unsubscribe)
+
     @callback
     def _on_tokens_refreshed(self, new_access: str, new_refresh: str) -> None:
         """Persist refreshed tokens to the config entry."""
@@ -327,8 +365,8 @@ class NanitHub:
         device_ip: str | None = None,
     ) -> NanitSoundLight:
         """Get or create a NanitSoundLight instance."""
-        if speaker_uid in self._sound_lights:
-            return self._sound_lights[speaker_uid]
+        if (existing := self._sound_lights.get(speaker_uid)) is not None:
+            return existing
 
         if self._client.token_manager is None:
             raise NanitAuthError("Not authenticated — call async_login first")
@@ -349,9 +387,9 @@ class NanitHub:
 
     async def async_close(self) -> None:
         """Stop all cameras and clean up."""
-        if self._unsubscribe_tokens is not None:
-            self._unsubscribe_tokens()
-            self._unsubscribe_tokens = None
+        for unsubscribe in self._unsubscribe_cameras:
+            unsubscribe()
+        self._unsubscribe_cameras.clear()
         await self._client.async_close()
         self._camera_data.clear()
         # Also stop S&L instances
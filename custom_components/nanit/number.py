@@ -66,6 +66,10 @@ class NanitSoundMachineVolume(NanitSoundLightEntity, NumberEntity):
             return None
         return round(float(vol) * 100, 0)
 
+    def _state_fingerprint(self) -> tuple[float | None]:
+        """Return the volume so identical S&L state pushes skip the state write."""
+        return (self.native_value,)
+
     async def async_set_native_value(self, value: float) -> None:
         """Set the sound machine volume via local WebSocket."""
         try:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -19,7 +20,7 @@ from homeassistant.const import (
     UnitOfFrequency,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from aionanit.models import CameraState, NetworkInfo
@@ -53,7 +54,7 @@ SENSORS: tuple[NanitSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=True,
-        value_fn=lambda state: state.sensors.temperature,
+        value_fn=attrgetter("sensors.temperature"),
     ),
     NanitSensorEntityDescription(
         key="humidity",
@@ -62,7 +63,7 @@ SENSORS: tuple[NanitSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=True,
         suggested_display_precision=1,
-        value_fn=lambda state: state.sensors.humidity,
+        value_fn=attrgetter("sensors.humidity"),
     ),
     NanitSensorEntityDescription(
         key="light",
@@ -70,7 +71,7 @@ SENSORS: tuple[NanitSensorEntityDescription, ...] = (
         native_unit_of_measurement=LIGHT_LUX,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda state: state.sensors.light,
+        value_fn=attrgetter("sensors.light"),
     ),
 )
 
@@ -114,7 +115,7 @@ NETWORK_SENSORS: tuple[NanitNetworkSensorDescription, ...] = (
         key="wifi_ssid",
         translation_key="wifi_ssid",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda net: net.ssid,
+        value_fn=attrgetter("ssid"),
     ),
     NanitNetworkSensorDescription(
         key="wifi_signal",
@@ -123,7 +124,7 @@ NETWORK_SENSORS: tuple[NanitNetworkSensorDescription, ...] = (
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda net: net.signal_dbm,
+        value_fn=attrgetter("signal_dbm"),
     ),
     NanitNetworkSensorDescription(
         key="wifi_frequency",
@@ -132,7 +133,7 @@ NETWORK_SENSORS: tuple[NanitNetworkSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfFrequency.MEGAHERTZ,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda net: net.frequency_mhz,
+        value_fn=attrgetter("frequency_mhz"),
     ),
 )
 
@@ -178,14 +179,24 @@ class NanitSensor(NanitEntity, SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.camera.uid}_{description.key}"
+        self._attr_native_value = self._value_from_data()
 
-    @property
-    def native_value(self) -> float | int | None:
-        """Return the state of the sensor."""
+    def _value_from_data(self) -> float | int | None:
+        """Extract the sensor value from the coordinator data."""
         if self.coordinator.data is None:
             return None
         return self.entity_description.value_fn(self.coordinator.data)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the sensor value once per update instead of per state read."""
+        self._attr_native_value = self._value_from_data()
+        super()._handle_coordinator_update()
+
+    def _state_fingerprint(self) -> tuple[float | int | None]:
+        """Return the sensor value so unrelated pushes skip the state write."""
+        return (self._attr_native_value,)
+
 
 class NanitSLSensor(NanitSoundLightEntity, SensorEntity):
     """Nanit Sound & Light Machine Sensor (temperature, humidity)."""
@@ -10,9 +10,10 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity, SwitchEntityDescription
 from homeassistant.const import STATE_OFF, STATE_ON
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from aionanit import NanitCamera
@@ -97,6 +98,7 @@ class NanitSwitch(NanitEntity, RestoreEntity, SwitchEntity):
         # Track the last command so stale push events are suppressed.
         self._command_state: bool | None = None
         self._command_ts: float = 0.0
+        self._cancel_grace_timer: CALLBACK_TYPE | None = None
         self._attr_unique_id = f"{camera.uid}_{description.key}"
         if coordinator.data is not None:
             self._attr_is_on = self.entity_description.value_fn(coordinator.data)
@@ -116,6 +118,11 @@ class NanitSwitch(NanitEntity, RestoreEntity, SwitchEntity):
         ):
             self._attr_is_on = last_state.state == STATE_ON
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending grace-period timer."""
+        self._clear_command()
+        await super().async_will_remove_from_hass()
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on.
@@ -142,7 +149,7 @@ class NanitSwitch(NanitEntity, RestoreEntity, SwitchEntity):
                     if elapsed < _COMMAND_GRACE_PERIOD:
                         if new_value == self._command_state:
                             # Push confirms the command — accept and clear.
-                            self._command_state = None
+                            self._clear_command()
                             self._attr_is_on = new_value
                         else:
                             # Stale push contradicts the command — skip.
@@ -155,43 +162,77 @@ class NanitSwitch(NanitEntity, RestoreEntity, SwitchEntity):
                             )
                     else:
                         # Grace period expired — accept whatever the camera says.
-                        self._command_state = None
+                        self._clear_command()
                         self._attr_is_on = new_value
                 else:
                     self._attr_is_on = new_value
             # If new_value is None, keep the previous _attr_is_on (last-known).
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
+
+    def _start_command(self, state: bool) -> None:
+        """Record an optimistic command and schedule its grace-period expiry.
+
+        The camera does not re-deliver unchanged pushes, so a command it never
+        applies would otherwise keep the optimistic state until some unrelated
+        field changes. The timer re-evaluates the coordinator data instead.
+        """
+        self._clear_command()
+        self._command_state = state
+        self._command_ts = time.monotonic()
+        if self.hass is None:
+            return
+        self._cancel_grace_timer = async_call_later(
+            self.hass, _COMMAND_GRACE_PERIOD, self._handle_grace_expired
+        )
+
+    def _clear_command(self) -> None:
+        """Forget the pending command and cancel its grace-period timer."""
+        self._command_state = None
+        if self._cancel_grace_timer is not None:
+            self._cancel_grace_timer()
+            self._cancel_grace_timer = None
+
+    @callback
+    def _handle_grace_expired(self, _now: object = None) -> None:
+        """Accept the camera's reported state once the grace period ends."""
+        self._cancel_grace_timer = None
+        if self._command_state is None:
+            return
+        self._command_state = None
+        self._handle_coordinator_update()
+
+    def _state_fingerprint(self) -> tuple[bool | None]:
+        """Return the switch state so a push echoing the optimistic write is skipped."""
+        return (self._attr_is_on,)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
         previous = self._attr_is_on
         self._attr_is_on = True
-        self._command_state = True
-        self._command_ts = time.monotonic()
-        self.async_write_ha_state()
+        self._start_command(True)
+        self._async_write_state_if_changed()
         try:
             await self.entity_description.turn_on_fn(self._camera)
         except Exception:
             _LOGGER.warning("Failed to turn on %s, reverting state", self.entity_description.key)
             self._attr_is_on = previous
-            self._command_state = None
-            self.async_write_ha_state()
+            self._clear_command()
+            self._async_write_state_if_changed()
             raise
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
         previous = self._attr_is_on
         self._attr_is_on = False
-        self._command_state = False
-        self._command_ts = time.monotonic()
-        self.async_write_ha_state()
+        self._start_command(False)
+        self._async_write_state_if_changed()
         try:
             await self.entity_description.turn_off_fn(self._camera)
         except Exception:
             _LOGGER.warning("Failed to turn off %s, reverting state", self.entity_description.key)
             self._attr_is_on = previous
-            self._command_state = None
-            self.async_write_ha_state()
+            self._clear_command()
+            self._async_write_state_if_changed()
             raise
 
 
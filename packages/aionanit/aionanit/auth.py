@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import contextlib
 import json
+import logging
 import time
 from collections.abc import Callable
 from typing import TYPE_CHECKING
@@ -14,6 +16,8 @@ from .exceptions import NanitAuthError, NanitConnectionError
 if TYPE_CHECKING:
     from .rest import NanitRestClient
 
+_LOGGER = logging.getLogger(__name__)
+
 
 def _expires_at_from_jwt(access_token: str, fallback_expires_in: float) -> float:
     """Return monotonic expiry from a JWT exp claim, falling back to expires_in."""
@@ -31,8 +35,9 @@ def _expires_at_from_jwt(access_token: str, fallback_expires_in: float) -> float
 class TokenManager:
     """Manages access/refresh tokens with automatic proactive renewal.
 
-    Does not own the REST client — caller provides it. Acquires an
-    asyncio.Lock around refresh operations to prevent concurrent refreshes.
+    Does not own the REST client — caller provides it. Concurrent callers
+    that find the token stale share one in-flight refresh task instead of
+    each running (or queueing for) their own.
     """
 
     def __init__(
@@ -46,8 +51,8 @@ class TokenManager:
         self._access_token: str = access_token
         self._refresh_token: str = refresh_token
         self._expires_at: float = _expires_at_from_jwt(access_token, expires_in)
-        self._lock: asyncio.Lock = asyncio.Lock()
-        self._callbacks: list[Callable[[str, str], None]] = []
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._callbacks: tuple[Callable[[str, str], None], ...] = ()
 
     @property
     def access_token(self) -> str:
@@ -68,10 +73,14 @@ class TokenManager:
         refresh_token: str,
         expires_in: float = 3600.0,
     ) -> None:
-        async with self._lock:
-            self._access_token = access_token
-            self._refresh_token = refresh_token
-            self._expires_at = _expires_at_from_jwt(access_token, expires_in)
+        # Let an in-flight refresh settle first so it can't overwrite
+        # the tokens being installed here.
+        if self._refresh_task is not None and not self._refresh_task.done():
+            with contextlib.suppress(Exception):
+                await asyncio.shield(self._refresh_task)
+        self._access_token = access_token
+        self._refresh_token = refresh_token
+        self._expires_at = _expires_at_from_jwt(access_token, expires_in)
 
     async def async_get_access_token(self, min_ttl: float = 300.0) -> str:
         """Return a valid access token, refreshing when inside min_ttl.
@@ -80,23 +89,43 @@ class TokenManager:
         leaves headroom for retries (callers naturally retry on their poll
         cadence) instead of racing the token's hard expiry.
         """
-        callbacks_to_fire: list[Callable[[str, str], None]] = []
-        async with self._lock:
-            if time.monotonic() + min_ttl >= self._expires_at:
-                await self._async_refresh()
-                callbacks_to_fire = list(self._callbacks)
-
-        for callback in callbacks_to_fire:
-            callback(self._access_token, self._refresh_token)
+        if time.monotonic() + min_ttl < self._expires_at:
+            return self._access_token
 
+        await self._async_shared_refresh()
         return self._access_token
 
     async def async_force_refresh(self) -> None:
-        async with self._lock:
-            await self._async_refresh()
+        await self._async_shared_refresh()
 
+    async def _async_shared_refresh(self) -> None:
+        """Refresh the tokens, joining a refresh that is already in flight.
+
+        The task is shielded so a cancelled caller doesn't abort the refresh
+        other callers are waiting on. A finished task whose done callback has
+        not run yet is never joined: it would skip a forced refresh or
+        re-raise a stale failure instead of retrying.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._async_refresh_and_notify())
+            self._refresh_task.add_done_callback(self._on_refresh_done)
+        await asyncio.shield(self._refresh_task)
+
+    async def _async_refresh_and_notify(self) -> None:
+        await self._async_refresh()
+        # A failing callback must not fail the refresh every waiter shares.
         for callback in self._callbacks:
-            callback(self._access_token, self._refresh_token)
+            try:
+                callback(self._access_token, self._refresh_token)
+            except Exception:
+                _LOGGER.exception("Error in token refresh callback")
+
+    def _on_refresh_done(self, task: asyncio.Task[None]) -> None:
+        """Clear the in-flight refresh and mark its failure as retrieved."""
+        if self._refresh_task is task:
+            self._refresh_task = None
+        if not task.cancelled():
+            task.exception()
 
     async def _async_refresh(self) -> None:
         try:
@@ -122,9 +151,11 @@ class TokenManager:
 
         Returns an unsubscribe function that removes the callback.
         """
-        self._callbacks.append(callback)
+        self._callbacks = (*self._callbacks, callback)
 
         def _unsubscribe() -> None:
-            self._callbacks.remove(callback)
+            callbacks = list(self._callbacks)
+            callbacks.remove(callback)
+            self._callbacks = tuple(callbacks)
 
         return _unsubscribe
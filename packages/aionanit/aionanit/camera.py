@@ -55,11 +55,13 @@ from .rest import NanitRestClient
 from .ws.pending import PendingRequests
 from .ws.protocol import (
     build_request,
+    build_request_template,
     decode_message,
     extract_request,
     extract_response,
+    render_request_template,
 )
-from .ws.transport import WsTransport
+from .ws.transport import LOCAL_WS_PORT, WsTransport
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -77,6 +79,36 @@ Streaming = proto.Streaming
 Playback = proto.Playback
 Soundtrack = proto.Soundtrack
 
+# Serialized payloads for requests that never vary; only the id is spliced
+# in per send (see render_request_template).
+_GET_STATUS_TEMPLATE = build_request_template(
+    RequestType.GET_STATUS, get_status=GetStatus(all=True)
+)
+_GET_SETTINGS_TEMPLATE = build_request_template(
+    RequestType.GET_SETTINGS, get_settings=GetSettings(all=True)
+)
+_GET_CONTROL_TEMPLATE = build_request_template(
+    RequestType.GET_CONTROL, get_control=GetControl(night_light=True)
+)
+_GET_SENSOR_DATA_TEMPLATE = build_request_template(
+    RequestType.GET_SENSOR_DATA, get_sensor_data=GetSensorData(all=True)
+)
+_GET_PLAYBACK_TEMPLATE = build_request_template(RequestType.GET_PLAYBACK)
+_GET_SOUNDTRACKS_TEMPLATE = build_request_template(RequestType.GET_SOUNDTRACKS)
+_ENABLE_SENSOR_PUSH_TEMPLATE = build_request_template(
+    RequestType.PUT_CONTROL,
+    control=Control(
+        sensor_data_transfer=ControlSensorDataTransfer(
+            sound=True,
+            motion=True,
+            temperature=True,
+            humidity=True,
+            light=True,
+            night=True,
+        )
+    ),
+)
+
 _DEFAULT_REQUEST_TIMEOUT: float = 10.0
 _LOCAL_PROBE_INTERVAL: float = 300.0  # 5 minutes
 _MAX_LOCAL_FAILURES_BEFORE_CLOUD: int = 3
@@ -87,6 +119,33 @@ _TOKEN_REFRESH_MIN_TTL: float = 360.0  # pre-emptive refresh threshold (> the 33
 _DEFAULT_SENSOR_POLL_INTERVAL: float = 120.0  # 2 min — poll sensors camera doesn't push
 _DEFAULT_PLAYBACK_POLL_INTERVAL: float = 30.0  # 30s — poll GET_PLAYBACK for external changes
 _STREAM_TOKEN_MIN_TTL: float = 3300.0  # Keep 45-minute HA sources inside JWT lifetime
+_SNAPSHOT_SKIP_AUTO_HEADERS: tuple[str, ...] = ("Accept-Encoding",)
+_LOCAL_TCP_PROBE_TIMEOUT: float = 1.0
+
+
+async def _async_tcp_reachable(host: str, port: int, timeout: float) -> bool:
+    """Return whether a plain TCP connection to *host*:*port* succeeds."""
+    try:
+        async with asyncio.timeout(timeout):
+            _, writer = await asyncio.open_connection(host, port)
+    except (TimeoutError, OSError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+def _ignore_probe_message(_data: bytes) -> None:
+    """Discard frames received on a temporary local probe transport."""
+
+
+def _ignore_probe_connection_change(
+    _state: ConnectionState, _kind: TransportKind, _error: str | None
+) -> None:
+    """Discard connection changes reported by a temporary local probe transport."""
 
 
 class NanitCamera:
@@ -129,7 +188,9 @@ class NanitCamera:
             self._on_connection_change,
             get_headers=self._async_get_cloud_headers,
         )
-        self._subscribers: list[Callable[[CameraEvent], None]] = []
+        # Rebuilt on (un)subscribe so notifying iterates an immutable
+        # snapshot that callbacks may safely unsubscribe from.
+        self._subscribers: tuple[Callable[[CameraEvent], None], ...] = ()
         self._local_probe_task: asyncio.Task[None] | None = None
         self._health_check_task: asyncio.Task[None] | None = None
         self._sensor_poll_task: asyncio.Task[None] | None = None
@@ -141,6 +202,18 @@ class NanitCamera:
         self._stopped: bool = False
         self._connected_event: asyncio.Event = asyncio.Event()
         self._connected_event.set()
+        self._push_handlers: dict[int, Callable[[Any], None]] = {
+            RequestType.PUT_SENSOR_DATA: self._on_push_sensor_data,
+            RequestType.PUT_STATUS: self._on_push_status,
+            RequestType.PUT_SETTINGS: self._on_push_settings,
+            RequestType.PUT_CONTROL: self._on_push_control,
+            RequestType.PUT_PLAYBACK: self._on_push_playback,
+        }
+        self._snapshot_url: str = f"https://api.nanit.com/babies/{baby_uid}/snapshot"
+        # Derived from the access token; rebuilt whenever the token changes.
+        self._cached_token: str | None = None
+        self._cached_rtmps_url: str = ""
+        self._cached_snapshot_headers: dict[str, str] = {}
 
     # ------------------------------------------------------------------
     # Properties
@@ -246,10 +319,12 @@ class NanitCamera:
 
         Returns an unsubscribe function.
         """
-        self._subscribers.append(callback)
+        self._subscribers = (*self._subscribers, callback)
 
         def _unsubscribe() -> None:
-            self._subscribers.remove(callback)
+            subscribers = list(self._subscribers)
+            subscribers.remove(callback)
+            self._subscribers = tuple(subscribers)
 
         return _unsubscribe
 
@@ -261,7 +336,7 @@ class NanitCamera:
         """GET_STATUS request (all fields)."""
         resp = await self._send_request(
             RequestType.GET_STATUS,
-            get_status=GetStatus(all=True),
+            template=_GET_STATUS_TEMPLATE,
         )
         status = _parse_status(resp)
         self._update_state(status=status, kind=CameraEventKind.STATUS_UPDATE)
@@ -271,7 +346,7 @@ class NanitCamera:
         """GET_SETTINGS request."""
         resp = await self._send_request(
             RequestType.GET_SETTINGS,
-            get_settings=GetSettings(all=True),
+            template=_GET_SETTINGS_TEMPLATE,
         )
         settings = _parse_settings(resp)
         self._update_state(settings=settings, kind=CameraEventKind.SETTINGS_UPDATE)
@@ -281,7 +356,7 @@ class NanitCamera:
         """GET_CONTROL request."""
         resp = await self._send_request(
             RequestType.GET_CONTROL,
-            get_control=GetControl(night_light=True),
+            template=_GET_CONTROL_TEMPLATE,
         )
         control = _parse_control(resp)
         self._update_state(control=control, kind=CameraEventKind.CONTROL_UPDATE)
@@ -293,7 +368,7 @@ class NanitCamera:
             Any,
             await self._send_request(
                 RequestType.GET_SENSOR_DATA,
-                get_sensor_data=GetSensorData(all=True),
+                template=_GET_SENSOR_DATA_TEMPLATE,
                 reconnect_on_failure=reconnect_on_failure,
             ),
         )
@@ -305,6 +380,7 @@ class NanitCamera:
         """GET_PLAYBACK request — query current sound machine state."""
         resp = await self._send_request(
             RequestType.GET_PLAYBACK,
+            template=_GET_PLAYBACK_TEMPLATE,
             reconnect_on_failure=reconnect_on_failure,
         )
         pb = _parse_playback(resp)
@@ -318,7 +394,9 @@ class NanitCamera:
 
     async def async_get_soundtracks(self) -> tuple[str, ...]:
         """GET_SOUNDTRACKS request — list available sound machine tracks."""
-        resp = await self._send_request(RequestType.GET_SOUNDTRACKS)
+        resp = await self._send_request(
+            RequestType.GET_SOUNDTRACKS, template=_GET_SOUNDTRACKS_TEMPLATE
+        )
         tracks = _parse_soundtracks(resp)
         if tracks:
             current = self._state.playback
@@ -480,13 +558,13 @@ class NanitCamera:
         Returns: rtmps://media-secured.nanit.com/nanit/{baby_uid}.{access_token}
         """
         token = await self._token_manager.async_get_access_token(min_ttl=_STREAM_TOKEN_MIN_TTL)
-        token_ttl = self._token_manager.expires_in
+        self._refresh_token_caches(token)
         _LOGGER.debug(
             "Built RTMPS stream URL for baby %s (token TTL: %.0fs)",
             self._baby_uid,
-            token_ttl,
+            self._token_manager.expires_in,
         )
-        return f"rtmps://media-secured.nanit.com/nanit/{self._baby_uid}.{token}"
+        return self._cached_rtmps_url
 
     async def async_start_streaming(
         self,
@@ -553,13 +631,19 @@ class NanitCamera:
         """
         try:
             token = await self._token_manager.async_get_access_token()
+            self._refresh_token_caches(token)
             resp = await self._session.get(
-                f"https://api.nanit.com/babies/{self._baby_uid}/snapshot",
-                headers={"Authorization": token},
+                self._snapshot_url,
+                headers=self._cached_snapshot_headers,
+                # JPEG is already compressed; don't advertise gzip/deflate.
+                skip_auto_headers=_SNAPSHOT_SKIP_AUTO_HEADERS,
                 timeout=aiohttp.ClientTimeout(total=15),
             )
             if resp.status == 200:
                 return await resp.read()
+            # Nothing reads the error body, so hand the connection back to
+            # the pool now instead of when the response is collected.
+            resp.release()
             _LOGGER.debug(
                 "Snapshot endpoint returned %s for baby %s",
                 resp.status,
@@ -569,6 +653,14 @@ class NanitCamera:
             _LOGGER.debug("Snapshot fetch failed: %s", err)
         return None
 
+    def _refresh_token_caches(self, token: str) -> None:
+        """Rebuild the token-derived stream URL and snapshot headers if the token changed."""
+        if token is self._cached_token:
+            return
+        self._cached_token = token
+        self._cached_rtmps_url = f"rtmps://media-secured.nanit.com/nanit/{self._baby_uid}.{token}"
+        self._cached_snapshot_headers = {"Authorization": token}
+
     # ------------------------------------------------------------------
     # Internal — header refresh for reconnect
     # ------------------------------------------------------------------
@@ -611,48 +703,46 @@ class NanitCamera:
 
         # KEEPALIVE — nothing to do (transport handles ping/pong).
 
-    def _handle_push_event(self, request: object) -> None:
+    def _handle_push_event(self, request: ProtoRequest) -> None:
         """Process a push REQUEST from the camera."""
-        if not isinstance(request, ProtoRequest):
+        req_type = request.type
+        handler = self._push_handlers.get(req_type)
+        if handler is None:
+            _LOGGER.debug("Unhandled push request type: %s", req_type)
             return
+        handler(request)
 
-        proto_request = cast(Any, request)
-        req_type = proto_request.type
-
-        if req_type == RequestType.PUT_SENSOR_DATA:
-            sensors = _parse_sensor_data(proto_request.sensor_data, self._state.sensors)
-            self._update_state(sensors=sensors, kind=CameraEventKind.SENSOR_UPDATE)
-
-        elif req_type == RequestType.PUT_STATUS:
-            if proto_request.HasField("status"):
-                status = _parse_status_from_proto(proto_request.status)
-                self._update_state(status=status, kind=CameraEventKind.STATUS_UPDATE)
-
-        elif req_type == RequestType.PUT_SETTINGS:
-            if proto_request.HasField("settings"):
-                incoming = _parse_settings_from_proto(proto_request.settings)
-                # Merge — push may omit unchanged fields (e.g. volume).
-                merged = dataclasses.replace(
-                    self._state.settings,
-                    **{f: v for f, v in dataclasses.asdict(incoming).items() if v is not None},
-                )
-                self._update_state(settings=merged, kind=CameraEventKind.SETTINGS_UPDATE)
+    def _on_push_sensor_data(self, request: Any) -> None:
+        sensors = _parse_sensor_data(request.sensor_data, self._state.sensors)
+        self._update_state(sensors=sensors, kind=CameraEventKind.SENSOR_UPDATE)
 
-        elif req_type == RequestType.PUT_CONTROL:
-            if proto_request.HasField("control"):
-                control = _parse_control_from_proto(proto_request.control)
-                self._update_state(control=control, kind=CameraEventKind.CONTROL_UPDATE)
+    def _on_push_status(self, request: Any) -> None:
+        if request.HasField("status"):
+            status = _parse_status_from_proto(request.status)
+            self._update_state(status=status, kind=CameraEventKind.STATUS_UPDATE)
+
+    def _on_push_settings(self, request: Any) -> None:
+        if request.HasField("settings"):
+            incoming = _parse_settings_from_proto(request.settings)
+            # Merge — push may omit unchanged fields (e.g. volume).
+            merged = dataclasses.replace(
+                self._state.settings,
+                **{f: v for f, v in dataclasses.asdict(incoming).items() if v is not None},
+            )
+            self._update_state(settings=merged, kind=CameraEventKind.SETTINGS_UPDATE)
 
-        elif req_type == RequestType.PUT_PLAYBACK:
-            if proto_request.HasField("playback"):
-                pb = _parse_playback_from_proto(proto_request.playback)
-                current_tracks = self._state.playback.available_tracks
-                if current_tracks and not pb.available_tracks:
-                    pb = dataclasses.replace(pb, available_tracks=current_tracks)
-                self._update_state(playback=pb, kind=CameraEventKind.PLAYBACK_UPDATE)
+    def _on_push_control(self, request: Any) -> None:
+        if request.HasField("control"):
+            control = _parse_control_from_proto(request.control)
+            self._update_state(control=control, kind=CameraEventKind.CONTROL_UPDATE)
 
-        else:
-            _LOGGER.debug("Unhandled push request type: %s", req_type)
+    def _on_push_playback(self, request: Any) -> None:
+        if request.HasField("playback"):
+            pb = _parse_playback_from_proto(request.playback)
+            current_tracks = self._state.playback.available_tracks
+            if current_tracks and not pb.available_tracks:
+                pb = dataclasses.replace(pb, available_tracks=current_tracks)
+            self._update_state(playback=pb, kind=CameraEventKind.PLAYBACK_UPDATE)
 
     # ------------------------------------------------------------------
     # Internal — connection change
@@ -730,26 +820,49 @@ class NanitCamera:
         playback: PlaybackState | None = None,
         kind: CameraEventKind,
     ) -> None:
-        """Apply a partial state update and notify subscribers."""
-        replacements: dict[str, Any] = {}
-        if sensors is not None:
-            replacements["sensors"] = sensors
-        if settings is not None:
-            replacements["settings"] = settings
-        if control is not None:
-            replacements["control"] = control
-        if status is not None:
-            replacements["status"] = status
-        if playback is not None:
-            replacements["playback"] = playback
-
-        if replacements:
-            self._state = dataclasses.replace(self._state, **replacements)
+        """Apply a partial state update and notify subscribers.
+
+        Parts equal to the current state are dropped; if nothing changed
+        (e.g. a sensor push repeating the last readings) subscribers are
+        not notified at all.
+        """
+        old = self._state
+        if sensors == old.sensors:
+            sensors = None
+        if settings == old.settings:
+            settings = None
+        if control == old.control:
+            control = None
+        if status == old.status:
+            status = None
+        if playback == old.playback:
+            playback = None
+        if (
+            sensors is None
+            and settings is None
+            and control is None
+            and status is None
+            and playback is None
+        ):
+            return
 
+        # Direct construction skips dataclasses.replace's per-call field
+        # introspection; this runs on every push frame. It must list every
+        # CameraState field (guarded by test_update_state_preserves_all_fields).
+        self._state = CameraState(
+            connection=old.connection,
+            sensors=old.sensors if sensors is None else sensors,
+            settings=old.settings if settings is None else settings,
+            control=old.control if control is None else control,
+            status=old.status if status is None else status,
+            playback=old.playback if playback is None else playback,
+        )
         self._notify_subscribers(kind)
 
     def _notify_subscribers(self, kind: CameraEventKind) -> None:
         """Fire all subscriber callbacks with the current state."""
+        if not self._subscribers:
+            return
         event = CameraEvent(kind=kind, state=self._state)
         for callback in self._subscribers:
             try:
@@ -766,10 +879,13 @@ class NanitCamera:
         request_type: int,
         timeout: float = _DEFAULT_REQUEST_TIMEOUT,
         reconnect_on_failure: bool = True,
+        template: bytes | None = None,
         **kwargs: Any,
     ) -> Any:
         """Send a protobuf request and await the correlated response.
 
+        Fixed payloads pass a pre-serialized *template* instead of *kwargs*.
+
         Includes automatic stale-connection detection and one transparent
         retry after inline reconnect so that commands succeed even when the
         server-side session has silently expired.
@@ -810,7 +926,11 @@ class NanitCamera:
                 await self._async_reconnect()
 
             request_id = self._pending.next_id()
-            data = build_request(request_id, request_type, **kwargs)
+            data = (
+                render_request_template(template, request_id)
+                if template is not None
+                else build_request(request_id, request_type, **kwargs)
+            )
             future = self._pending.track(request_id)
 
             try:
@@ -824,7 +944,8 @@ class NanitCamera:
                 raise
 
             try:
-                return await asyncio.wait_for(future, timeout=timeout)
+                async with asyncio.timeout(timeout):
+                    return await future
             except NanitTransportError:
                 if attempt == 0 and reconnect_on_failure:
                     _LOGGER.warning(
@@ -857,52 +978,43 @@ class NanitCamera:
     # ------------------------------------------------------------------
 
     async def _async_request_initial_state(self) -> None:
-        """Request full state from camera after connecting."""
-        try:
-            await self.async_get_status()
-        except (NanitRequestTimeout, NanitTransportError) as err:
-            _LOGGER.warning("Initial GET_STATUS failed: %s", err)
+        """Request full state from camera after connecting.
 
-        try:
-            await self.async_get_settings()
-        except (NanitRequestTimeout, NanitTransportError) as err:
-            _LOGGER.warning("Initial GET_SETTINGS failed: %s", err)
-
-        try:
-            await self.async_get_sensor_data()
-        except (NanitRequestTimeout, NanitTransportError) as err:
-            _LOGGER.warning("Initial GET_SENSOR_DATA failed: %s", err)
-
-        try:
-            await self.async_get_control()
-        except (NanitRequestTimeout, NanitTransportError) as err:
-            _LOGGER.warning("Initial GET_CONTROL failed: %s", err)
-
-        try:
-            await self.async_get_playback()
-        except (NanitRequestTimeout, NanitTransportError) as err:
-            _LOGGER.warning("Initial GET_PLAYBACK failed: %s", err)
-
-        try:
-            await self.async_get_soundtracks()
-        except (NanitRequestTimeout, NanitTransportError) as err:
-            _LOGGER.warning("Initial GET_SOUNDTRACKS failed: %s", err)
+        The GETs are independent and correlated by request id, so they are
+        sent together and cost one round trip instead of six.
+        """
+        names = (
+            "GET_STATUS",
+            "GET_SETTINGS",
+            "GET_SENSOR_DATA",
+            "GET_CONTROL",
+            "GET_PLAYBACK",
+            "GET_SOUNDTRACKS",
+        )
+        results = await asyncio.gather(
+            self.async_get_status(),
+            self.async_get_settings(),
+            self.async_get_sensor_data(),
+            self.async_get_control(),
+            self.async_get_playback(),
+            self.async_get_soundtracks(),
+            return_exceptions=True,
+        )
+        unexpected: BaseException | None = None
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, (NanitRequestTimeout, NanitTransportError)):
+                _LOGGER.warning("Initial %s failed: %s", name, result)
+            elif isinstance(result, BaseException) and unexpected is None:
+                unexpected = result
+        if unexpected is not None:
+            raise unexpected
 
     async def _async_enable_sensor_push(self) -> None:
         """Send PUT_CONTROL to enable sensor data push from camera."""
-        transfer = ControlSensorDataTransfer(
-            sound=True,
-            motion=True,
-            temperature=True,
-            humidity=True,
-            light=True,
-            night=True,
-        )
-        proto_control = Control(sensor_data_transfer=transfer)
         try:
             await self._send_request(
                 RequestType.PUT_CONTROL,
-                control=proto_control,
+                template=_ENABLE_SENSOR_PUSH_TEMPLATE,
             )
         except (NanitRequestTimeout, NanitTransportError) as err:
             _LOGGER.warning("Enable sensor push failed: %s", err)
@@ -1068,7 +1180,7 @@ class NanitCamera:
             while not self._stopped:
                 sleep_for = max(self._token_manager.expires_in - 300.0, 60.0)
                 await asyncio.sleep(sleep_for)
-                if self._stopped or not self._transport.connected:
+                if self._stopped:
                     continue
                 # Another path (e.g. a stream URL request) may have refreshed
                 # the token while we slept — skip the reconnect and re-derive
@@ -1097,6 +1209,12 @@ class NanitCamera:
                     # consumer-facing token fetch surfaces the reauth.
                     _LOGGER.error("Token refresh rejected, reauthentication required: %s", err)
                     return
+                # Refresh even while disconnected so REST callers (cloud
+                # polls, snapshots) find a fresh token instead of paying the
+                # refresh round-trip inline; only a live socket needs the
+                # reconnect — the reconnect loop picks up the new token.
+                if not self._transport.connected:
+                    continue
                 try:
                     await self._transport.async_force_reconnect()
                 except Exception:
@@ -1256,12 +1374,23 @@ class NanitCamera:
 
                 try:
                     _LOGGER.debug("Probing local camera at %s", self._local_ip)
+                    # A bare TCP handshake rules out an offline camera before
+                    # paying for the TLS + WebSocket upgrade below. This only
+                    # saves the probe transport while the camera is unreachable;
+                    # once the port answers, the WebSocket probe still runs (it
+                    # is what verifies the token) at the cost of one extra
+                    # TCP handshake.
+                    if not await _async_tcp_reachable(
+                        self._local_ip, LOCAL_WS_PORT, _LOCAL_TCP_PROBE_TIMEOUT
+                    ):
+                        _LOGGER.debug("Local camera port unreachable, staying on cloud")
+                        continue
                     token = await self._token_manager.async_get_access_token()
                     # Create a temporary transport to test local.
                     probe = WsTransport(
                         self._session,
-                        lambda _data: None,
-                        lambda _s, _t, _e: None,
+                        _ignore_probe_message,
+                        _ignore_probe_connection_change,
                     )
                     try:
                         await asyncio.wait_for(
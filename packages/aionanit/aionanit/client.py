@@ -150,8 +150,8 @@ class NanitClient:
         if self._token_manager is None:
             raise NanitAuthError("Not authenticated — call async_login first")
 
-        if uid in self._cameras:
-            return self._cameras[uid]
+        if (existing := self._cameras.get(uid)) is not None:
+            return existing
 
         cam = NanitCamera(
             uid=uid,
@@ -174,9 +174,9 @@ class NanitClient:
 
         Does NOT close the aiohttp session — the caller owns it.
         """
-        for cam in list(self._cameras.values()):
+        while self._cameras:
+            _, cam = self._cameras.popitem()
             try:
                 await cam.async_stop()
             except Exception:
                 _LOGGER.debug("Error stopping camera %s during close", cam.uid)
-        self._cameras.clear()
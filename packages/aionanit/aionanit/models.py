@@ -34,7 +34,7 @@ class SensorType(IntEnum):
     NIGHT = 5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SensorReading:
     sensor_type: SensorType
     value: int | None = None
@@ -43,7 +43,7 @@ class SensorReading:
     timestamp: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SensorState:
     temperature: float | None = None  # Celsius, from value_milli / 1000
     humidity: float | None = None  # Percentage
@@ -53,7 +53,7 @@ class SensorState:
     night: bool = False  # True = dark / night mode active
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettingsState:
     night_vision: bool | None = None
     volume: int | None = None  # 0-100
@@ -65,14 +65,14 @@ class SettingsState:
     night_light_brightness: int | None = None  # 0-100
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ControlState:
     night_light: NightLightState | None = None
     night_light_timeout: int | None = None
     sensor_data_transfer_enabled: bool | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusState:
     connected_to_server: bool | None = None
     firmware_version: str | None = None
@@ -80,7 +80,7 @@ class StatusState:
     mounting_mode: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlaybackState:
     """Current sound machine playback state."""
 
@@ -89,7 +89,7 @@ class PlaybackState:
     available_tracks: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectionInfo:
     state: ConnectionState = ConnectionState.DISCONNECTED
     transport: TransportKind = TransportKind.NONE
@@ -98,7 +98,7 @@ class ConnectionInfo:
     reconnect_attempts: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CameraState:
     """Complete snapshot of everything known about one camera."""
 
@@ -119,13 +119,13 @@ class CameraEventKind(Enum):
     CONNECTION_CHANGE = "connection_change"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CameraEvent:
     kind: CameraEventKind
     state: CameraState  # Full state snapshot after event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NetworkInfo:
     """WiFi network information reported by the camera."""
 
@@ -134,7 +134,7 @@ class NetworkInfo:
     signal_dbm: int | None = None  # e.g. -60
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Baby:
     uid: str
     name: str
@@ -145,7 +145,7 @@ class Baby:
     camera_last_seen: int | None = None  # Unix timestamp of last cloud contact
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CloudEvent:
     """Event from the Nanit cloud API (motion/sound notifications)."""
 
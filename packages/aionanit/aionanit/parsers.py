@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
 from .models import (
     ControlState,
     NightLightState,
@@ -8,6 +11,7 @@ from .models import (
     SettingsState,
     StatusState,
 )
+from .proto import Control as ProtoControl
 from .proto import (
     ControlNightLight,
     MountingMode,
@@ -16,17 +20,77 @@ from .proto import (
     SettingsWifiBand,
     StatusConnectionToServer,
 )
+from .proto import Playback as ProtoPlayback
+from .proto import SensorType as ProtoSensorType
+from .proto import Settings as ProtoSettings
+from .proto import Status as ProtoStatus
+
+
+def _enum_names(names: dict[int, str]) -> tuple[str, ...]:
+    """Turn a {enum value: name} map over 0..n-1 into a tuple indexed by value."""
+    if sorted(names) != list(range(len(names))):
+        raise ValueError(f"Enum values are not contiguous from 0: {sorted(names)}")
+    return tuple(names[value] for value in range(len(names)))
+
+
+def _enum_name(names: tuple[str, ...], value: int) -> str | None:
+    """Name for an enum value from an _enum_names() tuple; None if out of range."""
+    return names[value] if 0 <= value < len(names) else None
+
+
+# Indexed by the proto enum value; covers every value the enums define.
+_WIFI_BAND_NAMES = _enum_names(
+    {
+        SettingsWifiBand.ANY: "any",
+        SettingsWifiBand.FR2_4GHZ: "2.4ghz",
+        SettingsWifiBand.FR5_0GHZ: "5ghz",
+    }
+)
 
-_WIFI_BAND_MAP: dict[int, str] = {
-    SettingsWifiBand.ANY: "any",
-    SettingsWifiBand.FR2_4GHZ: "2.4ghz",
-    SettingsWifiBand.FR5_0GHZ: "5ghz",
+_MOUNTING_MODE_NAMES = _enum_names(
+    {
+        MountingMode.STAND: "stand",
+        MountingMode.TRAVEL: "travel",
+        MountingMode.SWITCH: "switch",
+    }
+)
+
+_NIGHT_LIGHT_STATES: dict[int, NightLightState] = {
+    ControlNightLight.LIGHT_ON: NightLightState.ON,
+    ControlNightLight.LIGHT_OFF: NightLightState.OFF,
 }
 
-_MOUNTING_MODE_MAP: dict[int, str] = {
-    MountingMode.STAND: "stand",
-    MountingMode.TRAVEL: "travel",
-    MountingMode.SWITCH: "switch",
+
+def _scaled_reading(sd: SensorData) -> float | None:
+    """Milli-unit reading if present, else the integer value; None keeps the old one."""
+    if sd.value_milli:
+        return sd.value_milli / 1000.0
+    if sd.value:
+        return float(sd.value)
+    return None
+
+
+def _raw_value(sd: SensorData) -> int:
+    return sd.value
+
+
+def _alert_flag(sd: SensorData) -> bool:
+    return sd.is_alert
+
+
+def _night_flag(sd: SensorData) -> bool:
+    return bool(sd.value)
+
+
+# Sensor type -> (SensorState field, reader). Keyed by plain ints so the
+# per-reading lookup avoids EnumTypeWrapper's Python-level __getattr__.
+_SENSOR_FIELDS: dict[int, tuple[str, Callable[[SensorData], Any]]] = {
+    ProtoSensorType.TEMPERATURE: ("temperature", _scaled_reading),
+    ProtoSensorType.HUMIDITY: ("humidity", _scaled_reading),
+    ProtoSensorType.LIGHT: ("light", _raw_value),
+    ProtoSensorType.SOUND: ("sound_alert", _alert_flag),
+    ProtoSensorType.MOTION: ("motion_alert", _alert_flag),
+    ProtoSensorType.NIGHT: ("night", _night_flag),
 }
 
 
@@ -34,43 +98,31 @@ def _parse_sensor_data(
     sensor_data_list: list[SensorData],
     current: SensorState,
 ) -> SensorState:
-    from .proto import SensorType as ProtoSensorType
-
-    temperature = current.temperature
-    humidity = current.humidity
-    light = current.light
-    sound_alert = current.sound_alert
-    motion_alert = current.motion_alert
-    night = current.night
-
+    if not sensor_data_list:
+        return current
+    fields: dict[str, Any] = {
+        "temperature": current.temperature,
+        "humidity": current.humidity,
+        "light": current.light,
+        "sound_alert": current.sound_alert,
+        "motion_alert": current.motion_alert,
+        "night": current.night,
+    }
+    changed = False
     for sd in sensor_data_list:
-        if sd.sensor_type == ProtoSensorType.TEMPERATURE:
-            if sd.value_milli:
-                temperature = sd.value_milli / 1000.0
-            elif sd.value:
-                temperature = float(sd.value)
-        elif sd.sensor_type == ProtoSensorType.HUMIDITY:
-            if sd.value_milli:
-                humidity = sd.value_milli / 1000.0
-            elif sd.value:
-                humidity = float(sd.value)
-        elif sd.sensor_type == ProtoSensorType.LIGHT:
-            light = sd.value
-        elif sd.sensor_type == ProtoSensorType.SOUND:
-            sound_alert = sd.is_alert
-        elif sd.sensor_type == ProtoSensorType.MOTION:
-            motion_alert = sd.is_alert
-        elif sd.sensor_type == ProtoSensorType.NIGHT:
-            night = bool(sd.value)
-
-    return SensorState(
-        temperature=temperature,
-        humidity=humidity,
-        light=light,
-        sound_alert=sound_alert,
-        motion_alert=motion_alert,
-        night=night,
-    )
+        entry = _SENSOR_FIELDS.get(sd.sensor_type)
+        if entry is None:
+            continue
+        name, read = entry
+        value = read(sd)
+        if value is not None and value != fields[name]:
+            fields[name] = value
+            changed = True
+    # Repeated readings are common; hand back the same instance so callers
+    # can short-circuit on it.
+    if not changed:
+        return current
+    return SensorState(**fields)
 
 
 def _parse_status(resp: Response) -> StatusState:
@@ -79,12 +131,7 @@ def _parse_status(resp: Response) -> StatusState:
     return StatusState()
 
 
-def _parse_status_from_proto(status: object) -> StatusState:
-    from .proto import Status as ProtoStatus
-
-    if not isinstance(status, ProtoStatus):
-        return StatusState()
-
+def _parse_status_from_proto(status: ProtoStatus) -> StatusState:
     connected: bool | None = None
     if status.HasField("connection_to_server"):
         connected = status.connection_to_server == StatusConnectionToServer.CONNECTED
@@ -93,7 +140,7 @@ def _parse_status_from_proto(status: object) -> StatusState:
         connected_to_server=connected,
         firmware_version=status.current_version or None,
         hardware_version=status.hardware_version or None,
-        mounting_mode=_MOUNTING_MODE_MAP.get(status.mode),
+        mounting_mode=_enum_name(_MOUNTING_MODE_NAMES, status.mode),
     )
 
 
@@ -103,22 +150,17 @@ def _parse_settings(resp: Response) -> SettingsState:
     return SettingsState()
 
 
-def _parse_settings_from_proto(settings: object) -> SettingsState:
-    from .proto import Settings as ProtoSettings
-
-    if not isinstance(settings, ProtoSettings):
-        return SettingsState()
-
+def _parse_settings_from_proto(settings: ProtoSettings) -> SettingsState:
     return SettingsState(
         night_vision=settings.night_vision if settings.HasField("night_vision") else None,
         volume=settings.volume if settings.HasField("volume") else None,
         sleep_mode=settings.sleep_mode if settings.HasField("sleep_mode") else None,
         status_light_on=settings.status_light_on if settings.HasField("status_light_on") else None,
         mic_mute_on=settings.mic_mute_on if settings.HasField("mic_mute_on") else None,
-        wifi_band=_WIFI_BAND_MAP.get(settings.wifi_band)
+        wifi_band=_enum_name(_WIFI_BAND_NAMES, settings.wifi_band)
         if settings.HasField("wifi_band")
         else None,
-        mounting_mode=_MOUNTING_MODE_MAP.get(settings.mounting_mode)
+        mounting_mode=_enum_name(_MOUNTING_MODE_NAMES, settings.mounting_mode)
         if settings.HasField("mounting_mode")
         else None,
         night_light_brightness=max(0, min(100, settings.night_light_brightness))
@@ -133,24 +175,16 @@ def _parse_control(resp: Response) -> ControlState:
     return ControlState()
 
 
-def _parse_control_from_proto(control: object) -> ControlState:
-    from .proto import Control as ProtoControl
-
-    if not isinstance(control, ProtoControl):
-        return ControlState()
-
+def _parse_control_from_proto(control: ProtoControl) -> ControlState:
     night_light: NightLightState | None = None
     if control.HasField("night_light"):
-        if control.night_light == ControlNightLight.LIGHT_ON:
-            night_light = NightLightState.ON
-        else:
-            night_light = NightLightState.OFF
+        night_light = _NIGHT_LIGHT_STATES.get(control.night_light, NightLightState.OFF)
 
     sensor_transfer_enabled: bool | None = None
     if control.HasField("sensor_data_transfer"):
         sdt = control.sensor_data_transfer
-        sensor_transfer_enabled = any(
-            [sdt.sound, sdt.motion, sdt.temperature, sdt.humidity, sdt.light, sdt.night]
+        sensor_transfer_enabled = bool(
+            sdt.sound or sdt.motion or sdt.temperature or sdt.humidity or sdt.light or sdt.night
         )
 
     return ControlState(
@@ -169,13 +203,8 @@ def _parse_playback(resp: Response) -> PlaybackState:
     return PlaybackState()
 
 
-def _parse_playback_from_proto(playback: object) -> PlaybackState:
+def _parse_playback_from_proto(playback: ProtoPlayback) -> PlaybackState:
     """Parse a protobuf Playback message into PlaybackState."""
-    from .proto import Playback as ProtoPlayback
-
-    if not isinstance(playback, ProtoPlayback):
-        return PlaybackState()
-
     playing = playback.status == ProtoPlayback.STARTED
 
     current_track: str | None = None
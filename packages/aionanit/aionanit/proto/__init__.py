@@ -6,6 +6,10 @@ This module provides flat aliases that match the names used throughout
 the codebase so consumers don't need to know the nesting.
 """
 
+import logging
+
+from google.protobuf.internal import api_implementation
+
 from .nanit_pb2 import (
     Control,
     GetControl,
@@ -29,6 +33,15 @@ from .nanit_pb2 import (
     Streaming,
 )
 
+# Every WebSocket frame is decoded here. protobuf falls back to its
+# pure-Python backend silently (e.g. no wheel for the platform, or
+# PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python), which is many times slower.
+if api_implementation.Type() == "python":
+    logging.getLogger(__name__).warning(
+        "protobuf is using its pure-Python implementation; camera message "
+        "decoding will be slow. Install a protobuf wheel with the upb backend."
+    )
+
 # ---------------------------------------------------------------------------
 # Enum aliases — keep the flat names the rest of the codebase expects.
 # Google protobuf puts nested enum *values* directly on the parent class
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from datetime import UTC, datetime
 from typing import Any
 
 import aiohttp
@@ -80,6 +81,25 @@ def _parse_camera_last_seen(baby_json: dict[str, Any]) -> int | None:
     return int(val) if isinstance(val, int | float) else None
 
 
+def _parse_event_time(raw: Any) -> float | None:
+    """Return an event time as a Unix timestamp, or None if unparseable.
+
+    The messages endpoint reports numeric timestamps; ISO-8601 strings are
+    accepted too and go through the C-implemented ``datetime.fromisoformat``.
+    """
+    if isinstance(raw, int | float) and not isinstance(raw, bool):
+        return float(raw)
+    if not isinstance(raw, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
 # Headers required by the Nanit API. The API rejects requests without
 # nanit-api-version (especially when MFA is enabled) and may reject
 # requests with a non-mobile User-Agent.
@@ -103,6 +123,17 @@ class NanitRestClient:
     ) -> None:
         self._session: aiohttp.ClientSession = session
         self._base_url: str = base_url.rstrip("/")
+        # Headers for the most recent access token; nearly every call in a
+        # token's lifetime reuses them.
+        self._auth_token: str | None = None
+        self._auth_headers: dict[str, str] = {}
+
+    def _headers_for(self, access_token: str) -> dict[str, str]:
+        """Return the API headers authorized with *access_token*."""
+        if access_token is not self._auth_token:
+            self._auth_token = access_token
+            self._auth_headers = {**NANIT_API_HEADERS, "Authorization": access_token}
+        return self._auth_headers
 
     @property
     def base_url(self) -> str:
@@ -179,7 +210,7 @@ class NanitRestClient:
             resp = await self._session.post(
                 f"{self._base_url}/tokens/refresh",
                 json={"refresh_token": refresh_token},
-                headers={**NANIT_API_HEADERS, "Authorization": access_token},
+                headers=self._headers_for(access_token),
                 timeout=_DEFAULT_TIMEOUT,
             )
         except (TimeoutError, aiohttp.ClientError) as err:
@@ -223,7 +254,7 @@ class NanitRestClient:
         try:
             resp = await self._session.get(
                 f"{self._base_url}/babies",
-                headers={**NANIT_API_HEADERS, "Authorization": access_token},
+                headers=self._headers_for(access_token),
                 timeout=_DEFAULT_TIMEOUT,
             )
         except aiohttp.ClientError as err:
@@ -303,7 +334,7 @@ class NanitRestClient:
             resp = await self._session.get(
                 f"{self._base_url}/babies/{baby_uid}/messages",
                 params={"limit": limit},
-                headers={**NANIT_API_HEADERS, "Authorization": access_token},
+                headers=self._headers_for(access_token),
                 timeout=_DEFAULT_TIMEOUT,
             )
         except aiohttp.ClientError as err:
@@ -315,11 +346,16 @@ class NanitRestClient:
         resp.raise_for_status()
         body = await resp.json()
 
-        return [
-            CloudEvent(
-                event_type=msg["type"],
-                timestamp=msg["time"],
-                baby_uid=baby_uid,
+        events: list[CloudEvent] = []
+        for msg in body.get("messages", []):
+            timestamp = _parse_event_time(msg.get("time"))
+            if timestamp is None:
+                continue
+            events.append(
+                CloudEvent(
+                    event_type=msg["type"],
+                    timestamp=timestamp,
+                    baby_uid=baby_uid,
+                )
             )
-            for msg in body.get("messages", [])
-        ]
+        return events
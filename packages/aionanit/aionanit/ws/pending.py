@@ -8,13 +8,16 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from aionanit.proto import Response
 
+# Request.id is an int32 on the wire; ids cycle through 1.._MAX_REQUEST_ID.
+_MAX_REQUEST_ID = 2**31 - 1
+
 
 class PendingRequests:
     """Tracks outgoing requests and correlates them with responses.
 
     Each request gets a unique ID and an asyncio.Future.
     When a response arrives with a matching request_id, the future is resolved.
-    Timeouts are enforced via asyncio.wait_for at the call site.
+    Timeouts are enforced via asyncio.timeout at the call site.
     """
 
     def __init__(self) -> None:
@@ -22,8 +25,8 @@ class PendingRequests:
         self._counter: int = 0
 
     def next_id(self) -> int:
-        """Return next unique request ID (monotonically increasing)."""
-        self._counter += 1
+        """Return the next request ID, wrapping back to 1 after the int32 maximum."""
+        self._counter = self._counter % _MAX_REQUEST_ID + 1
         return self._counter
 
     def track(self, request_id: int) -> asyncio.Future[Response]:
@@ -56,13 +59,13 @@ class PendingRequests:
         Otherwise, futures are cancelled.
         Clears the pending map.
         """
-        for future in self._pending.values():
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
             if not future.done():
                 if error is not None:
                     future.set_exception(error)
                 else:
                     future.cancel()
-        self._pending.clear()
 
     @property
     def pending_count(self) -> int:
@@ -36,9 +36,12 @@ def decode_message(data: bytes) -> Message:
         raise NanitProtocolError(f"Failed to decode message: {err}") from err
 
 
+_KEEPALIVE_BYTES: bytes = encode_message(Message(type=MessageType.KEEPALIVE))
+
+
 def build_keepalive() -> bytes:
-    """Build a serialized KEEPALIVE message."""
-    return encode_message(Message(type=MessageType.KEEPALIVE))
+    """Return the serialized KEEPALIVE message (a constant, encoded once)."""
+    return _KEEPALIVE_BYTES
 
 
 def build_request(
@@ -58,26 +61,73 @@ def build_request(
 
     Returns serialized bytes ready to send over WebSocket.
     """
-    payload = {
-        k: v
-        for k, v in dict(
-            streaming=streaming,
-            settings=settings,
-            control=control,
-            playback=playback,
-            get_status=get_status,
-            get_settings=get_settings,
-            get_sensor_data=get_sensor_data,
-            get_control=get_control,
-        ).items()
-        if v is not None
-    }
-
-    req = Request(id=request_id, type=request_type, **payload)
+    # protobuf leaves fields passed as None unset, so every payload can go
+    # straight into the constructor without filtering.
+    req = Request(
+        id=request_id,
+        type=request_type,
+        streaming=streaming,
+        settings=settings,
+        control=control,
+        playback=playback,
+        get_status=get_status,
+        get_settings=get_settings,
+        get_sensor_data=get_sensor_data,
+        get_control=get_control,
+    )
     msg = Message(type=MessageType.REQUEST, request=req)
     return encode_message(msg)
 
 
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative int as a protobuf base-128 varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+# Message.type = REQUEST (field 1, varint), then the Message.request tag
+# (field 2, length-delimited) — the bytes SerializeToString emits first.
+_REQUEST_ENVELOPE_PREFIX = b"\x08" + _encode_varint(MessageType.REQUEST) + b"\x12"
+_REQUEST_ID_TAG = b"\x08"  # Request.id (field 1, varint)
+
+
+def build_request_template(
+    request_type: int,
+    *,
+    control: Control | None = None,
+    get_status: GetStatus | None = None,
+    get_settings: GetSettings | None = None,
+    get_sensor_data: GetSensorData | None = None,
+    get_control: GetControl | None = None,
+) -> bytes:
+    """Pre-serialize a fixed REQUEST payload for render_request_template().
+
+    Returns the Request body without its id; fields after ``id`` are
+    serialized in field order, so rendering reproduces build_request's
+    output byte for byte.
+    """
+    request = Request(
+        type=request_type,
+        control=control,
+        get_status=get_status,
+        get_settings=get_settings,
+        get_sensor_data=get_sensor_data,
+        get_control=get_control,
+    )
+    result: bytes = request.SerializePartialToString()
+    return result
+
+
+def render_request_template(template: bytes, request_id: int) -> bytes:
+    """Splice *request_id* into a template from build_request_template()."""
+    body = _REQUEST_ID_TAG + _encode_varint(request_id) + template
+    return _REQUEST_ENVELOPE_PREFIX + _encode_varint(len(body)) + body
+
+
 def extract_response(msg: Message) -> Response | None:
     """Extract Response from a RESPONSE message, or None if not a response."""
     if msg.type == MessageType.RESPONSE:
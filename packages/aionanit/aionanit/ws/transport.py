@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import random
 import ssl
@@ -26,6 +27,19 @@ _BACKOFF_FACTOR: float = 1.618  # golden ratio
 _MAX_BACKOFF: float = 60.0
 _JITTER_MAX: float = 1.0
 _MAX_MSG_SIZE: int = 1_048_576  # 1 MiB
+LOCAL_WS_PORT: int = 442  # Camera's local (LAN) WebSocket port
+_WS_CLOSED_TYPES = frozenset(
+    {aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED}
+)
+
+
+@functools.cache
+def _local_ssl_context() -> ssl.SSLContext:
+    """Return the shared permissive context for the camera's self-signed cert."""
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
 
 
 class WsTransport:
@@ -110,18 +124,16 @@ class WsTransport:
     ) -> None:
         """Connect directly to the camera on the LAN.
 
-        URL:  wss://{camera_ip}:442
+        URL:  wss://{camera_ip}:{LOCAL_WS_PORT}
         Auth: Authorization: token {uc_token}
 
-        If *ssl_context* is ``None`` a permissive context is created
+        If *ssl_context* is ``None`` a shared permissive context is used
         (self-signed cert on the camera).
         """
-        url = f"wss://{camera_ip}:442"
+        url = f"wss://{camera_ip}:{LOCAL_WS_PORT}"
         headers = {"Authorization": f"token {uc_token}"}
         if ssl_context is None:
-            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            ssl_context = _local_ssl_context()
         await self._async_connect(url, headers, TransportKind.LOCAL, ssl_context=ssl_context)
 
     async def async_send(self, data: bytes) -> None:
@@ -138,7 +150,13 @@ class WsTransport:
             raise NanitTransportError(f"Send failed: {err}") from err
 
     async def async_close(self) -> None:
-        """Close connection and cancel background tasks. Idempotent."""
+        """Close connection and cancel background tasks. Idempotent.
+
+        DISCONNECTED is reported once; closing an already-closed transport
+        does not notify again.
+        """
+        if self._closed and self._ws is None:
+            return
         self._closed = True
         await self._async_close_ws()
         self._transport_kind = TransportKind.NONE
@@ -216,14 +234,17 @@ class WsTransport:
     async def _async_close_ws(self) -> None:
         """Close WebSocket and cancel background tasks."""
         current_task = asyncio.current_task()
-        for task in (self._recv_task, self._keepalive_task, self._reconnect_task):
-            if task is None or task.done() or task is current_task:
-                continue
+        tasks = [
+            task
+            for task in (self._recv_task, self._keepalive_task, self._reconnect_task)
+            if task is not None and not task.done() and task is not current_task
+        ]
+        for task in tasks:
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        if tasks:
+            # Cancelled tasks unwind together; the results (CancelledError)
+            # are collected, while a cancellation of this task still propagates.
+            await asyncio.gather(*tasks, return_exceptions=True)
         if self._recv_task is not current_task:
             self._recv_task = None
         if self._keepalive_task is not current_task:
@@ -242,24 +263,23 @@ class WsTransport:
     async def _recv_loop(self) -> None:
         """Read binary frames from the WebSocket and dispatch them."""
         assert self._ws is not None
+        loop_time = asyncio.get_running_loop().time
+        on_message = self._on_message
         try:
             async for msg in self._ws:
-                if msg.type == aiohttp.WSMsgType.BINARY:
-                    self._last_received_at = asyncio.get_event_loop().time()
+                msg_type = msg.type
+                if msg_type == aiohttp.WSMsgType.BINARY:
+                    self._last_received_at = loop_time()
                     try:
-                        self._on_message(msg.data)
+                        on_message(msg.data)
                     except Exception:
                         # A malformed/unexpected frame must not terminate the
                         # receive loop and take down an otherwise healthy WS.
                         _LOGGER.warning("Ignoring malformed Nanit WebSocket frame", exc_info=True)
-                elif msg.type in (
-                    aiohttp.WSMsgType.CLOSE,
-                    aiohttp.WSMsgType.CLOSING,
-                    aiohttp.WSMsgType.CLOSED,
-                ):
+                elif msg_type in _WS_CLOSED_TYPES:
                     _LOGGER.debug("WebSocket closed by server")
                     break
-                elif msg.type == aiohttp.WSMsgType.ERROR:
+                elif msg_type == aiohttp.WSMsgType.ERROR:
                     _LOGGER.error("WebSocket error: %s", self._ws.exception())
                     break
         except asyncio.CancelledError:
@@ -76,6 +76,26 @@ class TestGetAccessToken:
         assert token == "initial_access"
         mock_rest.async_refresh_token.assert_not_called()
 
+    async def test_fresh_token_returned_without_waiting_for_refresh(
+        self, token_manager: TokenManager, mock_rest: MagicMock
+    ) -> None:
+        release = asyncio.Event()
+
+        async def blocked_refresh(*args, **kwargs):
+            await release.wait()
+            return {"access_token": "new_access", "refresh_token": "new_refresh"}
+
+        mock_rest.async_refresh_token.side_effect = blocked_refresh
+        forced = asyncio.create_task(token_manager.async_force_refresh())
+        await asyncio.sleep(0)
+
+        token = await asyncio.wait_for(token_manager.async_get_access_token(), timeout=1.0)
+        assert token == "initial_access"
+
+        release.set()
+        await forced
+        assert token_manager.access_token == "new_access"
+
 
 class TestConcurrentRefresh:
     async def test_concurrent_calls_only_refresh_once(
@@ -101,6 +121,45 @@ class TestConcurrentRefresh:
         assert all(r == "new_access" for r in results)
         assert mock_rest.async_refresh_token.call_count == 1
 
+    async def test_cancelled_caller_does_not_abort_shared_refresh(
+        self, token_manager: TokenManager, mock_rest: MagicMock
+    ) -> None:
+        token_manager._expires_at = time.monotonic() - 1
+        release = asyncio.Event()
+
+        async def blocked_refresh(*args, **kwargs):
+            await release.wait()
+            return {"access_token": "new_access", "refresh_token": "new_refresh"}
+
+        mock_rest.async_refresh_token.side_effect = blocked_refresh
+        first = asyncio.create_task(token_manager.async_get_access_token())
+        second = asyncio.create_task(token_manager.async_get_access_token())
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == "new_access"
+        assert first.cancelled()
+        assert mock_rest.async_refresh_token.call_count == 1
+
+    async def test_finished_task_not_joined_before_done_callback(
+        self, token_manager: TokenManager, mock_rest: MagicMock
+    ) -> None:
+        async def _failed_refresh() -> None:
+            raise NanitConnectionError("old failure")
+
+        # A finished task still in the slot (its done callback not yet run).
+        stale = asyncio.create_task(_failed_refresh())
+        with pytest.raises(NanitConnectionError):
+            await stale
+        token_manager._refresh_task = stale
+
+        await token_manager.async_force_refresh()
+
+        assert token_manager.access_token == "new_access"
+        mock_rest.async_refresh_token.assert_awaited_once()
+
 
 class TestForceRefresh:
     async def test_force_refresh_updates_tokens(
@@ -167,6 +226,32 @@ class TestCallbacks:
         cb1.assert_called_once_with("new_access", "new_refresh")
         cb2.assert_called_once_with("new_access", "new_refresh")
 
+    async def test_failing_callback_does_not_fail_waiters(
+        self, token_manager: TokenManager, mock_rest: MagicMock
+    ) -> None:
+        original_return = mock_rest.async_refresh_token.return_value
+
+        async def slow_refresh(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return original_return
+
+        mock_rest.async_refresh_token.side_effect = slow_refresh
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        after = MagicMock()
+        token_manager.on_tokens_refreshed(failing)
+        token_manager.on_tokens_refreshed(after)
+        token_manager._expires_at = time.monotonic() - 1
+
+        results = await asyncio.gather(
+            token_manager.async_get_access_token(),
+            token_manager.async_get_access_token(),
+        )
+
+        assert results == ["new_access", "new_access"]
+        failing.assert_called_once_with("new_access", "new_refresh")
+        after.assert_called_once_with("new_access", "new_refresh")
+        assert mock_rest.async_refresh_token.call_count == 1
+
     async def test_unsubscribe_removes_callback(
         self, token_manager: TokenManager, mock_rest: MagicMock
     ) -> None:
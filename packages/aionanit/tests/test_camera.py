@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+from collections.abc import Callable
 from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
@@ -169,6 +171,21 @@ class TestSubscriptions:
         cam._notify_subscribers(CameraEventKind.SENSOR_UPDATE)
         assert len(events) == 1  # second subscriber still called
 
+    def test_subscriber_unsubscribing_during_notify_does_not_skip_others(self) -> None:
+        cam, *_ = _make_camera()
+        events: list[object] = []
+        unsubs: list[Callable[[], None]] = []
+
+        def _one_shot(_: object) -> None:
+            unsubs[0]()
+
+        unsubs.append(cam.subscribe(_one_shot))
+        cam.subscribe(lambda e: events.append(e))
+
+        cam._notify_subscribers(CameraEventKind.SENSOR_UPDATE)
+        cam._notify_subscribers(CameraEventKind.SENSOR_UPDATE)
+        assert len(events) == 2
+
 
 # ---------------------------------------------------------------------------
 # Connection change handling
@@ -248,6 +265,34 @@ class TestStateUpdate:
         assert cam.state.sensors.temperature == 22.0
         assert cam.state.settings.volume == 50
 
+    def test_unchanged_update_skips_notify(self) -> None:
+        cam, *_ = _make_camera()
+        events: list[object] = []
+        cam.subscribe(lambda e: events.append(e))
+
+        cam._update_state(sensors=SensorState(temperature=22.0), kind=CameraEventKind.SENSOR_UPDATE)
+        before = cam.state
+        cam._update_state(sensors=SensorState(temperature=22.0), kind=CameraEventKind.SENSOR_UPDATE)
+
+        assert len(events) == 1
+        assert cam.state is before
+
+    def test_update_state_preserves_all_fields(self) -> None:
+        # _update_state builds CameraState by hand; a field it forgets to
+        # carry over would silently reset to its default.
+        cam, *_ = _make_camera()
+        names = [f.name for f in dataclasses.fields(CameraState)]
+        sentinels = {name: object() for name in names}
+        cam._state = CameraState(**sentinels)
+        sensors = SensorState(temperature=21.0)
+
+        cam._update_state(sensors=sensors, kind=CameraEventKind.SENSOR_UPDATE)
+
+        assert cam.state.sensors is sensors
+        for name in names:
+            if name != "sensors":
+                assert getattr(cam.state, name) is sentinels[name], name
+
 
 # ---------------------------------------------------------------------------
 # Proto parsing helpers
@@ -260,6 +305,18 @@ class TestParseSensorData:
         result = _parse_sensor_data(data, SensorState())
         assert result.temperature == 23.5
 
+    def test_unchanged_readings_return_current_instance(self) -> None:
+        current = SensorState(temperature=23.5, light=120)
+        data = [
+            SensorData(sensor_type=ProtoSensorType.TEMPERATURE, value_milli=23500),
+            SensorData(sensor_type=ProtoSensorType.LIGHT, value=120),
+        ]
+        assert _parse_sensor_data(data, current) is current
+
+    def test_empty_readings_return_current_instance(self) -> None:
+        current = SensorState(temperature=23.5)
+        assert _parse_sensor_data([], current) is current
+
     def test_parses_humidity(self) -> None:
         data = [SensorData(sensor_type=ProtoSensorType.HUMIDITY, value_milli=55000)]
         result = _parse_sensor_data(data, SensorState())
@@ -338,10 +395,6 @@ class TestParseStatus:
         result = _parse_status_from_proto(proto_status)
         assert result.connected_to_server is False
 
-    def test_non_status_type_returns_default(self) -> None:
-        result = _parse_status_from_proto("not_a_status")
-        assert result == StatusState()
-
 
 class TestParseSettings:
     def test_empty_response(self) -> None:
@@ -370,10 +423,6 @@ class TestParseSettings:
         assert result.mounting_mode == "travel"
         assert result.night_light_brightness == 60
 
-    def test_non_settings_type_returns_default(self) -> None:
-        result = _parse_settings_from_proto("not_settings")
-        assert result == SettingsState()
-
     def test_partial_fields_leave_unset_as_none(self) -> None:
         """Settings with only volume set should leave other fields as None."""
         proto_settings = Settings(volume=42)
@@ -452,10 +501,6 @@ class TestParseControl:
         result = _parse_control_from_proto(proto_control)
         assert result.sensor_data_transfer_enabled is True
 
-    def test_non_control_type_returns_default(self) -> None:
-        result = _parse_control_from_proto("not_control")
-        assert result == ControlState()
-
     def test_partial_control_leaves_unset_as_none(self) -> None:
         """Control with only night_light_timeout should leave night_light as None."""
         proto_control = Control(night_light_timeout=30)
@@ -549,14 +594,6 @@ class TestHandlePushEvent:
         assert cam.state.control.night_light == NightLightState.ON
         assert events[0].kind == CameraEventKind.CONTROL_UPDATE
 
-    def test_ignores_non_proto_request(self) -> None:
-        cam, *_ = _make_camera()
-        events: list[object] = []
-        cam.subscribe(lambda e: events.append(e))
-
-        cam._handle_push_event("not_a_request")
-        assert len(events) == 0
-
     def test_unhandled_request_type(self) -> None:
         cam, *_ = _make_camera()
         events: list[object] = []
@@ -912,6 +949,18 @@ class TestStreaming:
         assert url == "rtmps://media-secured.nanit.com/nanit/baby_uid_1.fresh_token"
         tm.async_get_access_token.assert_awaited_once_with(min_ttl=3300.0)
 
+    async def test_rtmps_url_rebuilt_only_when_token_changes(self) -> None:
+        cam, tm, _ = _make_camera()
+        tm.async_get_access_token = AsyncMock(return_value="token_a")
+
+        first = await cam.async_get_stream_rtmps_url()
+        assert await cam.async_get_stream_rtmps_url() is first
+
+        tm.async_get_access_token = AsyncMock(return_value="token_b")
+        assert await cam.async_get_stream_rtmps_url() == (
+            "rtmps://media-secured.nanit.com/nanit/baby_uid_1.token_b"
+        )
+
     async def test_start_streaming_reuses_provided_rtmps_url(self) -> None:
         cam, tm, _ = _make_camera()
         tm.async_get_access_token = AsyncMock(return_value="token_a")
@@ -945,6 +994,7 @@ class TestSnapshot:
         session.get.assert_called_once_with(
             "https://api.nanit.com/babies/baby_uid_1/snapshot",
             headers={"Authorization": "snap_token"},
+            skip_auto_headers=("Accept-Encoding",),
             timeout=aiohttp.ClientTimeout(total=15),
         )
 
@@ -954,10 +1004,12 @@ class TestSnapshot:
 
         mock_resp = AsyncMock()
         mock_resp.status = 404
+        mock_resp.release = MagicMock()
         session.get = AsyncMock(return_value=mock_resp)
 
         result = await cam.async_get_snapshot()
         assert result is None
+        mock_resp.release.assert_called_once_with()
 
     async def test_snapshot_returns_none_on_exception(self) -> None:
         cam, tm, session = _make_camera()
@@ -1110,6 +1162,38 @@ class TestOnReconnected:
         cam._async_request_initial_state.assert_awaited_once()
         cam._async_enable_sensor_push.assert_awaited_once()
 
+    async def test_initial_state_requests_are_sent_concurrently(self) -> None:
+        """All initial GETs are in flight together; one failure skips none."""
+        cam, *_ = _make_camera()
+        in_flight = 0
+        peak = 0
+
+        async def _request() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        async def _timeout() -> None:
+            await _request()
+            raise NanitRequestTimeout("GET_STATUS", 1, 10.0)
+
+        cam.async_get_status = AsyncMock(side_effect=_timeout)
+        for name in (
+            "async_get_settings",
+            "async_get_sensor_data",
+            "async_get_control",
+            "async_get_playback",
+            "async_get_soundtracks",
+        ):
+            setattr(cam, name, AsyncMock(side_effect=_request))
+
+        await cam._async_request_initial_state()
+
+        assert peak == 6
+        cam.async_get_soundtracks.assert_awaited_once()
+
 
 # ---------------------------------------------------------------------------
 # Timeout triggers force reconnect
@@ -13,6 +13,7 @@ from aionanit.camera import (
     NanitCamera,
     RequestType,
     Response,
+    _async_tcp_reachable,
 )
 from aionanit.exceptions import (
     NanitCameraUnavailable,
@@ -351,6 +352,29 @@ async def test_token_refresh_refreshes_with_headroom_then_reconnects_once() -> N
     assert order == ["refresh:360.0", "reconnect"]
 
 
+@pytest.mark.asyncio
+async def test_token_refresh_runs_while_disconnected_without_reconnect() -> None:
+    """REST callers get a pre-refreshed token even when the socket is down."""
+    camera, token_manager = _make_camera()
+    camera._stopped = False
+    token_manager.expires_in = 50.0
+    camera._transport = MagicMock()
+    camera._transport.connected = False
+    camera._transport.async_force_reconnect = AsyncMock()
+
+    async def _refresh_then_stop(min_ttl: float = 60.0) -> str:
+        camera._stopped = True
+        return "fresh"
+
+    token_manager.async_get_access_token = AsyncMock(side_effect=_refresh_then_stop)
+
+    with patch("aionanit.camera.asyncio.sleep", AsyncMock(return_value=None)):
+        await asyncio.wait_for(camera._token_refresh_loop(), timeout=0.1)
+
+    token_manager.async_get_access_token.assert_awaited_once_with(min_ttl=360.0)
+    camera._transport.async_force_reconnect.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_token_refresh_transient_failure_retries_without_reconnect() -> None:
     """A transient refresh failure retries shortly and never bounces the socket."""
@@ -397,3 +421,56 @@ async def test_token_refresh_auth_rejection_stops_loop() -> None:
         await asyncio.wait_for(camera._token_refresh_loop(), timeout=0.1)
 
     camera._transport.async_force_reconnect.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_tcp_reachable_closes_successful_connection() -> None:
+    writer = MagicMock()
+    writer.wait_closed = AsyncMock()
+    open_connection = AsyncMock(return_value=(MagicMock(), writer))
+
+    with patch("aionanit.camera.asyncio.open_connection", open_connection):
+        assert await _async_tcp_reachable("192.168.1.50", 442, 1.0)
+
+    open_connection.assert_awaited_once_with("192.168.1.50", 442)
+    writer.close.assert_called_once()
+    writer.wait_closed.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_tcp_reachable_false_when_connection_refused() -> None:
+    open_connection = AsyncMock(side_effect=ConnectionRefusedError("refused"))
+
+    with patch("aionanit.camera.asyncio.open_connection", open_connection):
+        assert not await _async_tcp_reachable("192.168.1.50", 442, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_tcp_reachable_false_on_timeout() -> None:
+    open_connection = AsyncMock(side_effect=TimeoutError)
+
+    with patch("aionanit.camera.asyncio.open_connection", open_connection):
+        assert not await _async_tcp_reachable("192.168.1.50", 442, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_local_probe_skips_websocket_when_port_unreachable() -> None:
+    camera, token_manager = _make_camera()
+    camera._stopped = False
+    camera._local_ip = "192.168.1.50"
+    camera._transport = MagicMock()
+    camera._transport.transport_kind = TransportKind.CLOUD
+
+    async def _unreachable_then_stop(*_args: object) -> bool:
+        camera._stopped = True
+        return False
+
+    with (
+        patch("aionanit.camera.asyncio.sleep", AsyncMock(return_value=None)),
+        patch("aionanit.camera._async_tcp_reachable", side_effect=_unreachable_then_stop),
+        patch("aionanit.camera.WsTransport") as probe_cls,
+    ):
+        await asyncio.wait_for(camera._local_probe_loop(), timeout=0.1)
+
+    probe_cls.assert_not_called()
+    token_manager.async_get_access_token.assert_not_awaited()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import ExitStack
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
@@ -237,6 +238,23 @@ class TestAsyncClose:
             # Should not raise
             await client.async_close()
 
+    async def test_stops_camera_created_during_close(self) -> None:
+        client, _ = _make_client()
+        client.restore_tokens("at", "rt")
+        cam1 = client.camera("cam1", "baby1")
+        late_stop = AsyncMock()
+
+        with ExitStack() as stack:
+
+            async def _stop_and_add() -> None:
+                late = client.camera("cam2", "baby2")
+                stack.enter_context(patch.object(late, "async_stop", late_stop))
+
+            stack.enter_context(patch.object(cam1, "async_stop", side_effect=_stop_and_add))
+            await client.async_close()
+
+        late_stop.assert_awaited_once()
+
     async def test_idempotent(self) -> None:
         client, _ = _make_client()
         # Should not raise when no cameras exist
@@ -20,6 +20,11 @@ class TestNextId:
         ids = [p.next_id() for _ in range(5)]
         assert ids == [1, 2, 3, 4, 5]
 
+    def test_wraps_within_int32(self) -> None:
+        p = PendingRequests()
+        p._counter = 2**31 - 2
+        assert [p.next_id() for _ in range(3)] == [2**31 - 1, 1, 2]
+
 
 class TestTrack:
     async def test_creates_future(self) -> None:
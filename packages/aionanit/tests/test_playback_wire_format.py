@@ -276,6 +276,9 @@ class TestCameraPushPlaybackStopped:
     def test_push_put_playback_stopped_updates_state(self) -> None:
         """Simulate camera pushing PUT_PLAYBACK { status: STOPPED }."""
         cam = _make_camera()
+        cam._update_state(
+            playback=PlaybackState(playing=True), kind=CameraEventKind.PLAYBACK_UPDATE
+        )
         events: list[object] = []
         cam.subscribe(lambda e: events.append(e))
 
@@ -18,10 +18,12 @@ from aionanit.proto import (
 from aionanit.ws.protocol import (
     build_keepalive,
     build_request,
+    build_request_template,
     decode_message,
     encode_message,
     extract_request,
     extract_response,
+    render_request_template,
 )
 
 
@@ -99,6 +101,22 @@ class TestBuildRequest:
         assert msg.request.type == RequestType.GET_STATUS
 
 
+class TestRequestTemplate:
+    @pytest.mark.parametrize("request_id", [1, 127, 128, 300, 2**21, 2**31 - 1])
+    def test_render_matches_build_request(self, request_id: int) -> None:
+        template = build_request_template(RequestType.GET_STATUS, get_status=GetStatus(all=True))
+        assert render_request_template(template, request_id) == build_request(
+            request_id, RequestType.GET_STATUS, get_status=GetStatus(all=True)
+        )
+
+    def test_payloadless_template(self) -> None:
+        template = build_request_template(RequestType.GET_PLAYBACK)
+        msg = decode_message(render_request_template(template, 42))
+        assert msg.type == MessageType.REQUEST
+        assert msg.request.id == 42
+        assert msg.request.type == RequestType.GET_PLAYBACK
+
+
 class TestExtractResponse:
     def test_returns_response_for_response_message(self) -> None:
         resp = Response(request_id=1, status_code=200)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 from aiohttp import ClientConnectionError, ClientSession
 from aioresponses import aioresponses
+from yarl import URL
 
 from aionanit.exceptions import (
     NanitAuthError,
@@ -276,6 +277,18 @@ class TestGetBabies:
         )
         assert babies[1] == Baby(uid="baby789", name="Max", camera_uid="cam012", speaker_uid=None)
 
+    async def test_get_babies_sends_current_token(self, client: NanitRestClient) -> None:
+        with aioresponses() as m:
+            m.get(BABIES_URL, payload={"babies": []}, repeat=True)
+            await client.async_get_babies("token_a")
+            await client.async_get_babies("token_a")
+            await client.async_get_babies("token_b")
+
+        sent = [
+            call.kwargs["headers"]["Authorization"] for call in m.requests[("GET", URL(BABIES_URL))]
+        ]
+        assert sent == ["token_a", "token_a", "token_b"]
+
     async def test_get_babies_speaker_with_null_nested(self, client: NanitRestClient) -> None:
         with aioresponses() as m:
             m.get(
@@ -424,6 +437,22 @@ class TestGetEvents:
             event_type="SOUND", timestamp=1700000060.0, baby_uid="baby123"
         )
 
+    async def test_get_events_parses_iso_times(self, client: NanitRestClient) -> None:
+        with aioresponses() as m:
+            m.get(
+                EVENTS_URL,
+                payload={
+                    "messages": [
+                        {"type": "MOTION", "time": "2023-11-14T22:13:20Z"},
+                        {"type": "SOUND", "time": "2023-11-14T22:14:20"},
+                        {"type": "SOUND", "time": "not-a-time"},
+                    ]
+                },
+            )
+            events = await client.async_get_events("token123", "baby123")
+
+        assert [event.timestamp for event in events] == [1700000000.0, 1700000060.0]
+
     async def test_get_events_empty(self, client: NanitRestClient) -> None:
         with aioresponses() as m:
             m.get(EVENTS_URL, payload={"messages": []})
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import ssl
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
@@ -52,8 +53,8 @@ class TestAsyncClose:
         t, _, _, conn_cb = _make_transport()
         await t.async_close()
         await t.async_close()
-        # Should not raise; conn_cb called each time
-        assert conn_cb.call_count == 2
+        # Should not raise; DISCONNECTED is only reported once
+        assert conn_cb.call_count == 1
 
     async def test_fires_disconnected_callback(self) -> None:
         t, _, _, conn_cb = _make_transport()
@@ -132,6 +133,23 @@ class TestAsyncConnectLocal:
 
         await t.async_close()
 
+    async def test_reuses_default_ssl_context(self) -> None:
+        contexts = []
+        for ip in ("192.168.1.50", "192.168.1.51"):
+            t, session, _, _ = _make_transport()
+            mock_ws = AsyncMock(spec=aiohttp.ClientWebSocketResponse)
+            mock_ws.closed = False
+            mock_ws.__aiter__ = MagicMock(return_value=iter([]))
+            session.ws_connect = AsyncMock(return_value=mock_ws)
+
+            await t.async_connect_local(ip, "uctoken123")
+            contexts.append(session.ws_connect.call_args[1]["ssl"])
+            await t.async_close()
+
+        assert contexts[0] is contexts[1]
+        assert contexts[0].verify_mode == ssl.CERT_NONE
+        assert contexts[0].check_hostname is False
+
 
 class TestIdleSeconds:
     async def test_idle_seconds_resets_on_connect(self) -> None:
@@ -168,7 +186,8 @@ class TestIdleSeconds:
 
         await t.async_connect_cloud("cam1", "tok1")
         t._closed = True
-        await asyncio.sleep(0.05)
+        assert t._recv_task is not None
+        await asyncio.wait_for(t._recv_task, 1.0)
 
         # A binary message was received — idle should be small.
         assert t.idle_seconds < 1.0
@@ -203,7 +222,8 @@ class TestRecvLoop:
 
         await t.async_connect_cloud("cam1", "tok1")
         t._closed = True
-        await asyncio.sleep(0.05)
+        assert t._recv_task is not None
+        await asyncio.wait_for(t._recv_task, 1.0)
 
         msg_cb.assert_called_once_with(b"\x08\x00")
         await t.async_close()
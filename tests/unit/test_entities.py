@@ -49,6 +49,7 @@ from custom_components.nanit.camera import NanitCameraEntity
 from custom_components.nanit.const import CLOUD_EVENT_WINDOW
 from custom_components.nanit.coordinator import (
     _AVAILABILITY_GRACE_SECONDS,
+    NanitCloudCoordinator,
     NanitPushCoordinator,
 )
 from custom_components.nanit.media_player import NanitMediaPlayer
@@ -179,6 +180,25 @@ def test_sensor_returns_none_when_no_data() -> None:
     assert entity.native_value is None
 
 
+def test_sensor_skips_state_write_when_value_unchanged() -> None:
+    coordinator = _push_coordinator(_camera_state(temperature=22.5, volume=40))
+    entity = NanitSensor(coordinator, _sensor_description("temperature"))
+    _disable_state_writes(entity)
+
+    entity._handle_coordinator_update()
+    coordinator.data = _camera_state(temperature=22.5, volume=60)
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 1
+
+    coordinator.data = _camera_state(temperature=23.0, volume=60)
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 2
+
+    coordinator.connected = False
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 3
+
+
 def test_binary_sensor_connectivity_on_when_connected() -> None:
     coordinator = _push_coordinator(_camera_state(connection_state=ConnectionState.CONNECTED))
     entity = NanitBinarySensor(coordinator, _binary_description("connectivity"))
@@ -226,17 +246,23 @@ def test_cloud_binary_motion_on_when_event_within_window() -> None:
         assert entity.is_on is True
 
 
-def test_cloud_binary_motion_matches_event_type_case_insensitively() -> None:
+async def test_cloud_binary_motion_matches_event_type_case_insensitively(
+    hass: HomeAssistant,
+) -> None:
     now = 10_000.0
-    coordinator = _cloud_coordinator(
-        [
-            CloudEvent(
-                event_type="motion",
-                timestamp=now - 1,
-                baby_uid="baby_1",
-            )
-        ]
+    entry = MockConfigEntry(domain="nanit", data={}, version=2, unique_id="test@example.com")
+    entry.add_to_hass(hass)
+    hub = MagicMock()
+    hub.client.token_manager.async_get_access_token = AsyncMock(return_value="token")
+    hub.client.rest_client.async_get_events = AsyncMock(
+        return_value=[CloudEvent(event_type="motion", timestamp=now - 1, baby_uid="baby_1")]
     )
+    cloud = NanitCloudCoordinator(hass, entry, hub, MOCK_BABY_1)
+
+    events = await cloud._async_update_data()
+
+    assert [event.event_type for event in events] == ["MOTION"]
+    coordinator = _cloud_coordinator(events)
     entity = NanitCloudBinarySensor(coordinator, _cloud_binary_description("cloud_motion"))
 
     with patch("custom_components.nanit.binary_sensor.time_mod.time", return_value=now):
@@ -267,6 +293,29 @@ def test_cloud_binary_sensor_off_when_no_events() -> None:
     assert entity.is_on is False
 
 
+def test_cloud_binary_sensor_rescans_only_when_coordinator_data_changes() -> None:
+    now = 10_000.0
+    events = [CloudEvent(event_type="MOTION", timestamp=now - 1, baby_uid="baby_1")]
+    coordinator = _cloud_coordinator(events)
+    entity = NanitCloudBinarySensor(coordinator, _cloud_binary_description("cloud_motion"))
+
+    with patch("custom_components.nanit.binary_sensor.time_mod.time", return_value=now):
+        assert entity.is_on is True
+
+    # Same payload later: the cached timestamp ages out of the window.
+    with patch(
+        "custom_components.nanit.binary_sensor.time_mod.time",
+        return_value=now + CLOUD_EVENT_WINDOW + 1,
+    ):
+        assert entity.is_on is False
+
+    # A new poll result is scanned again.
+    later = now + CLOUD_EVENT_WINDOW + 1
+    coordinator.data = [CloudEvent(event_type="MOTION", timestamp=later, baby_uid="baby_1")]
+    with patch("custom_components.nanit.binary_sensor.time_mod.time", return_value=later):
+        assert entity.is_on is True
+
+
 async def test_switch_camera_power_turn_off_calls_sleep_mode() -> None:
     coordinator = _push_coordinator(_camera_state(sleep_mode=False))
     camera = MagicMock(uid="cam_1")
@@ -282,6 +331,68 @@ async def test_switch_camera_power_turn_off_calls_sleep_mode() -> None:
     assert entity.is_on is False
 
 
+async def test_switch_skips_state_write_for_push_confirming_optimistic_state() -> None:
+    coordinator = _push_coordinator(_camera_state(sleep_mode=True))
+    camera = MagicMock(uid="cam_1")
+    camera.async_set_settings = AsyncMock()
+    entity = NanitSwitch(coordinator, camera, _switch_description("camera_power"))
+    _disable_state_writes(entity)
+
+    await entity.async_turn_on()
+    coordinator.data = _camera_state(sleep_mode=False)
+    entity._handle_coordinator_update()
+
+    assert entity.is_on is True
+    assert entity.async_write_ha_state.call_count == 1
+
+
+async def test_switch_reverts_when_command_never_applied(hass: HomeAssistant) -> None:
+    # The camera keeps reporting sleep_mode=True; unchanged pushes are not
+    # re-delivered, so only the grace timer can end the optimistic state.
+    coordinator = _push_coordinator(_camera_state(sleep_mode=True))
+    camera = MagicMock(uid="cam_1")
+    camera.async_set_settings = AsyncMock()
+    entity = NanitSwitch(coordinator, camera, _switch_description("camera_power"))
+    entity.hass = await _resolve_hass(hass)
+    _disable_state_writes(entity)
+
+    expiry_callback: Any | None = None
+
+    def _capture_timer(_hass: HomeAssistant, _seconds: float, callback):
+        nonlocal expiry_callback
+        expiry_callback = callback
+        return MagicMock()
+
+    with patch("custom_components.nanit.switch.async_call_later", side_effect=_capture_timer):
+        await entity.async_turn_on()
+
+    assert entity.is_on is True
+    assert expiry_callback is not None
+
+    expiry_callback(None)
+
+    assert entity.is_on is False
+    assert entity.async_write_ha_state.call_count == 2
+
+
+async def test_switch_confirmed_command_cancels_grace_timer(hass: HomeAssistant) -> None:
+    coordinator = _push_coordinator(_camera_state(sleep_mode=True))
+    camera = MagicMock(uid="cam_1")
+    camera.async_set_settings = AsyncMock()
+    entity = NanitSwitch(coordinator, camera, _switch_description("camera_power"))
+    entity.hass = await _resolve_hass(hass)
+    _disable_state_writes(entity)
+    cancel_timer = MagicMock()
+
+    with patch("custom_components.nanit.switch.async_call_later", return_value=cancel_timer):
+        await entity.async_turn_on()
+    coordinator.data = _camera_state(sleep_mode=False)
+    entity._handle_coordinator_update()
+
+    cancel_timer.assert_called_once()
+    assert entity.is_on is True
+
+
 def test_media_player_state_playing_when_playback_playing_true() -> None:
     coordinator = _push_coordinator(
         _camera_state(playback=PlaybackState(playing=True, current_track="White Noise.wav"))
@@ -573,7 +684,7 @@ async def test_availability_grace_period_hides_brief_disconnect(hass: HomeAssist
         "custom_components.nanit.coordinator.async_call_later",
         return_value=cancel_timer,
     ) as mock_call_later:
-        coordinator._on_camera_event(
+        coordinator.async_handle_camera_event(
             _MODELS.CameraEvent(
                 kind=_MODELS.CameraEventKind.CONNECTION_CHANGE,
                 state=_camera_state(connection_state=ConnectionState.DISCONNECTED),
@@ -586,6 +697,62 @@ async def test_availability_grace_period_hides_brief_disconnect(hass: HomeAssist
     assert coordinator._availability_timer is cancel_timer
 
 
+@pytest.mark.asyncio
+async def test_availability_grace_period_not_extended_by_repeat_disconnects(
+    hass: HomeAssistant,
+) -> None:
+    entry = MockConfigEntry(domain="nanit", data={}, version=2, unique_id="test@example.com")
+    entry.add_to_hass(hass)
+
+    camera = MagicMock(uid="cam_1", baby_uid="baby_1")
+    camera.connected = False
+    camera.subscribe = MagicMock(return_value=lambda: None)
+
+    coordinator = NanitPushCoordinator(hass, entry, camera, MOCK_BABY_1)
+    coordinator.connected = True
+
+    cancel_timer = MagicMock()
+    with patch(
+        "custom_components.nanit.coordinator.async_call_later",
+        return_value=cancel_timer,
+    ) as mock_call_later:
+        for _ in range(3):
+            coordinator.async_handle_camera_event(
+                _MODELS.CameraEvent(
+                    kind=_MODELS.CameraEventKind.CONNECTION_CHANGE,
+                    state=_camera_state(connection_state=ConnectionState.RECONNECTING),
+                )
+            )
+
+    mock_call_later.assert_called_once()
+    cancel_timer.assert_not_called()
+    assert coordinator._availability_timer is cancel_timer
+
+
+@pytest.mark.asyncio
+async def test_push_coordinator_coalesces_events_into_one_update(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(domain="nanit", data={}, version=2, unique_id="test@example.com")
+    entry.add_to_hass(hass)
+
+    camera = MagicMock(uid="cam_1", baby_uid="baby_1")
+    camera.connected = True
+
+    coordinator = NanitPushCoordinator(hass, entry, camera, MOCK_BABY_1)
+    coordinator.async_set_updated_data = MagicMock()
+
+    first = _camera_state(temperature=21.0)
+    latest = _camera_state(temperature=23.0)
+    for state in (first, latest):
+        coordinator.async_handle_camera_event(
+            _MODELS.CameraEvent(kind=_MODELS.CameraEventKind.SENSOR_UPDATE, state=state)
+        )
+
+    coordinator.async_set_updated_data.assert_not_called()
+    await hass.async_block_till_done()
+
+    coordinator.async_set_updated_data.assert_called_once_with(latest)
+
+
 @pytest.mark.asyncio
 async def test_availability_grace_period_expires(hass: HomeAssistant) -> None:
     entry = MockConfigEntry(domain="nanit", data={}, version=2, unique_id="test@example.com")
@@ -613,7 +780,7 @@ async def test_availability_grace_period_expires(hass: HomeAssistant) -> None:
         "custom_components.nanit.coordinator.async_call_later",
         side_effect=_capture_timer,
     ):
-        coordinator._on_camera_event(
+        coordinator.async_handle_camera_event(
             _MODELS.CameraEvent(
                 kind=_MODELS.CameraEventKind.CONNECTION_CHANGE,
                 state=_camera_state(connection_state=ConnectionState.DISCONNECTED),
@@ -656,7 +823,7 @@ async def test_reconnect_within_grace_cancels_timer(hass: HomeAssistant) -> None
         "custom_components.nanit.coordinator.async_call_later",
         side_effect=_capture_timer,
     ):
-        coordinator._on_camera_event(
+        coordinator.async_handle_camera_event(
             _MODELS.CameraEvent(
                 kind=_MODELS.CameraEventKind.CONNECTION_CHANGE,
                 state=_camera_state(connection_state=ConnectionState.DISCONNECTED),
@@ -664,7 +831,7 @@ async def test_reconnect_within_grace_cancels_timer(hass: HomeAssistant) -> None
         )
 
     camera.connected = True
-    coordinator._on_camera_event(
+    coordinator.async_handle_camera_event(
         _MODELS.CameraEvent(
             kind=_MODELS.CameraEventKind.CONNECTION_CHANGE,
             state=_camera_state(connection_state=ConnectionState.CONNECTED),
@@ -772,6 +939,32 @@ async def test_camera_stream_source_schedules_backend_expiry_timer(
     assert entity._cancel_stream_keepalive_timer is cancel_timer
 
 
+async def test_camera_concurrent_snapshot_requests_share_one_fetch(
+    hass: HomeAssistant,
+) -> None:
+    hass = await _resolve_hass(hass)
+    coordinator = _push_coordinator(_camera_state(sleep_mode=False))
+    camera = MagicMock(uid="cam_1")
+    release = asyncio.Event()
+
+    async def _slow_snapshot() -> bytes:
+        await release.wait()
+        return b"jpeg"
+
+    camera.async_get_snapshot = AsyncMock(side_effect=_slow_snapshot)
+    entity = NanitCameraEntity(coordinator, camera)
+    entity.hass = hass
+
+    first = asyncio.ensure_future(entity.async_camera_image())
+    second = asyncio.ensure_future(entity.async_camera_image())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == b"jpeg"
+    assert await second == b"jpeg"
+    camera.async_get_snapshot.assert_awaited_once()
+
+
 def test_camera_invalidates_stream_on_power_state_change() -> None:
     from datetime import UTC, datetime
 
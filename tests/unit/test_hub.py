@@ -70,6 +70,35 @@ async def test_setup_single_baby(hass: HomeAssistant, mock_nanit_client) -> None
     assert MOCK_BABY_1.camera_uid in hub.camera_data
 
 
+async def test_setup_unsubscribes_camera_when_start_fails(
+    hass: HomeAssistant, mock_nanit_client
+) -> None:
+    camera = _make_mock_camera(MOCK_BABY_1.camera_uid, MOCK_BABY_1.uid)
+    unsubscribe = MagicMock()
+    camera.subscribe = MagicMock(return_value=unsubscribe)
+    camera.async_start = AsyncMock(side_effect=NanitConnectionError("unreachable"))
+    mock_nanit_client.camera.side_effect = None
+    mock_nanit_client.camera.return_value = camera
+
+    entry = _make_entry(hass)
+    hub = NanitHub(hass, MagicMock(), entry)
+
+    with (
+        patch("custom_components.nanit.hub.NanitPushCoordinator") as push_cls,
+        patch("custom_components.nanit.hub.NanitCloudCoordinator") as cloud_cls,
+        patch("custom_components.nanit.hub.NanitNetworkCoordinator") as net_cls,
+    ):
+        push_cls.return_value = MagicMock(async_setup=AsyncMock())
+        cloud_cls.return_value = MagicMock(async_config_entry_first_refresh=AsyncMock())
+        net_cls.return_value = MagicMock(async_config_entry_first_refresh=AsyncMock())
+        with pytest.raises(NanitConnectionError):
+            await hub.async_setup()
+
+    camera.subscribe.assert_called_once_with(push_cls.return_value.async_handle_camera_event)
+    unsubscribe.assert_called_once_with()
+    push_cls.return_value.async_setup.assert_not_awaited()
+
+
 async def test_setup_multiple_babies(hass: HomeAssistant, mock_nanit_client) -> None:
     mock_nanit_client.async_get_babies.return_value = [MOCK_BABY_1, MOCK_BABY_2, MOCK_BABY_3]
     mock_nanit_client.camera.side_effect = lambda **kw: _make_mock_camera(kw["uid"], kw["baby_uid"])
@@ -276,6 +305,24 @@ async def test_token_refresh_callback(hass: HomeAssistant, mock_nanit_client) ->
     assert entry.data[CONF_REFRESH_TOKEN] == "new_refresh"
 
 
+async def test_token_refresh_callback_removed_on_entry_unload(
+    hass: HomeAssistant, mock_nanit_client
+) -> None:
+    unsubscribe = MagicMock()
+    mock_nanit_client.token_manager.on_tokens_refreshed.return_value = unsubscribe
+    mock_nanit_client.async_get_babies.side_effect = NanitAuthError("expired")
+    entry = _make_entry(hass)
+    hub = NanitHub(hass, MagicMock(), entry)
+
+    with pytest.raises(NanitAuthError):
+        await hub.async_setup()
+    unsubscribe.assert_not_called()
+
+    await entry._async_process_on_unload(hass)
+
+    unsubscribe.assert_called_once_with()
+
+
 async def test_setup_camera_timeout_treated_as_connection_failure(
     hass: HomeAssistant, mock_nanit_client
 ) -> None:
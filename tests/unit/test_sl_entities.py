@@ -911,6 +911,20 @@ def test_sl_volume_returns_none_when_volume_is_none() -> None:
     assert entity.native_value is None
 
 
+def test_sl_volume_skips_state_write_when_volume_unchanged() -> None:
+    from custom_components.nanit.number import NanitSoundMachineVolume
+
+    coordinator = _sl_coordinator(SoundLightFullState(volume=0.5, power_on=True))
+    entity = NanitSoundMachineVolume(coordinator)
+    _disable_state_writes(entity)
+
+    entity._handle_coordinator_update()
+    coordinator.data = SoundLightFullState(volume=0.5, power_on=False)
+    entity._handle_coordinator_update()
+
+    assert entity.async_write_ha_state.call_count == 1
+
+
 async def test_sl_volume_set_value() -> None:
     from custom_components.nanit.number import NanitSoundMachineVolume
 
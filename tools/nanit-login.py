@@ -2,6 +2,8 @@
 """Authenticate with Nanit cloud and save session for local testing.
 
 Saves tokens + baby info to .nanit-session (JSON) for use by other tools.
+An existing session is renewed with its refresh token when possible, so
+repeat runs skip the password and MFA prompts (use --force to log in again).
 """
 
 from __future__ import annotations
@@ -15,47 +17,81 @@ from pathlib import Path
 
 import aiohttp
 
-from aionanit import NanitAuthError, NanitClient, NanitConnectionError, NanitMfaRequiredError
+from aionanit import (
+    Baby,
+    NanitAuthError,
+    NanitClient,
+    NanitConnectionError,
+    NanitMfaRequiredError,
+)
 
 SESSION_FILE = Path(__file__).resolve().parents[1] / ".nanit-session"
 
 
+async def _async_resume_session(client: NanitClient) -> list[Baby] | None:
+    """Renew the saved session via its refresh token; None if a full login is needed."""
+    if not SESSION_FILE.exists():
+        return None
+    try:
+        data = json.loads(SESSION_FILE.read_text())
+        client.restore_tokens(data["access_token"], data["refresh_token"])
+    except (ValueError, KeyError, TypeError):
+        return None
+    try:
+        return await client.async_get_babies()
+    except NanitAuthError:
+        print("Saved session expired, logging in again.", file=sys.stderr)
+        return None
+
+
 async def async_main() -> int:
     parser = argparse.ArgumentParser(description="Login to Nanit cloud.")
     parser.add_argument("--email", help="Nanit account email")
     parser.add_argument("--password", help="Nanit account password")
+    parser.add_argument(
+        "--force", action="store_true", help="Ignore the saved session and log in again"
+    )
     args = parser.parse_args()
 
-    email = args.email or input("Email: ")
-    password = args.password or getpass("Password: ")
-
     async with aiohttp.ClientSession() as session:
         try:
             client = NanitClient(session)
-            try:
-                result = await client.async_login(email, password)
-            except NanitMfaRequiredError as err:
-                code = getpass("MFA code: ")
-                result = await client.async_verify_mfa(email, password, err.mfa_token, code)
-
-            access_token = result["access_token"]
-            refresh_token = result["refresh_token"]
-            babies = await client.async_get_babies()
+            babies = None
+            if not (args.force or args.email or args.password):
+                babies = await _async_resume_session(client)
+
+            if babies is None:
+                email = args.email or input("Email: ")
+                password = args.password or getpass("Password: ")
+                try:
+                    await client.async_login(email, password)
+                except NanitMfaRequiredError as err:
+                    code = getpass("MFA code: ")
+                    await client.async_verify_mfa(email, password, err.mfa_token, code)
+                babies = await client.async_get_babies()
 
             if not babies:
                 print("Error: no babies found on account", file=sys.stderr)
                 return 1
 
+            tm = client.token_manager
+            if tm is None:
+                print("Error: not authenticated", file=sys.stderr)
+                return 1
+
             baby = babies[0]
             session_data = {
-                "access_token": access_token,
-                "refresh_token": refresh_token,
+                "access_token": tm.access_token,
+                "refresh_token": tm.refresh_token,
                 "baby_uid": baby.uid,
                 "camera_uid": baby.camera_uid,
                 "baby_name": baby.name,
             }
 
-            SESSION_FILE.write_text(json.dumps(session_data, indent=2) + "\n")
+            # Write then rename so an interrupted run never leaves a torn session.
+            tmp_file = SESSION_FILE.with_name(SESSION_FILE.name + ".tmp")
+            tmp_file.write_text(json.dumps(session_data, indent=2) + "\n")
+            tmp_file.replace(SESSION_FILE)
 
             print(f"Logged in. Baby: {session_data['baby_name']} (uid={session_data['baby_uid']})")
             print(f"Session saved to {SESSION_FILE.name}")